@@ -4,17 +4,53 @@ Processes messages through the full pipeline:
 state -> LLM -> tools -> text -> TTS -> audio.
 """
 
-import json
+import asyncio
+import re
+from collections import deque
+from functools import lru_cache
 
-from backend.constants import ASSISTANT_STATES, WS_TYPES_OUT
+import orjson
+
+from backend.constants import ASSISTANT_STATES, TOOL_NAMES, WS_TYPES_OUT
 from backend import elevenlabs_tts, profile_store, school_config, tools as tools_module
 from backend.tools import TOOL_DEFINITIONS, MAX_TOOL_CALLS_PER_TURN
 
-# Chat history: keep last 10 messages in memory
-_chat_history: list[dict] = []
+# Chat history: keep last 10 messages in memory (oldest evicted automatically)
 MAX_HISTORY = 10
+_chat_history: deque[dict] = deque(maxlen=MAX_HISTORY)
 MAX_RESPONSE_CHARS = 480
 
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"[.!?]\s")
+
+# Fixed-shape WS frames, encoded once at import
+_STATE_FRAMES = {
+    state: orjson.dumps({"type": "assistant_state", "state": state}).decode()
+    for state in ASSISTANT_STATES
+}
+_TOOL_STATUS_FRAMES = {
+    (tool, status): orjson.dumps({"type": "tool_status", "tool": tool, "status": status}).decode()
+    for tool in TOOL_NAMES
+    for status in ("calling", "done", "error")
+}
+
+# Spoken replies for tools whose successful result needs no LLM narration
+_TERMINAL_REPLIES = {
+    "add_calendar_item": lambda args, result: (
+        f"Done, I added {args.get('title') or 'that'} to your calendar."
+    ),
+    "start_study_session": lambda args, result: (
+        f"Your {args.get('duration_min', 25)} minute study session"
+        f"{' for ' + args['topic'] if args.get('topic') else ''} has started. You've got this!"
+    ),
+    "stop_study_session": lambda args, result: (
+        f"Nice work! You studied for {result.get('elapsed_min', 0)} minutes."
+    ),
+    "spotify_search_link": lambda args, result: (
+        f"Here's a Spotify link for {args.get('query') or 'that'}. Enjoy!"
+    ),
+}
+
 # Base system prompt — school-specific context is injected dynamically
 SYSTEM_PROMPT_BASE = """You are Vuddy, a friendly and helpful AI campus desk buddy for college students. You help with:
 - Finding campus events and activities
@@ -31,74 +67,93 @@ Personality:
 - Be proactive in suggesting relevant events or activities
 
 When using tools, always explain what you found in a natural, conversational way.
-Never mention internal tool names to the user."""
+Never mention internal tool names to the user.
+Tool results may list records in a "*_toon" field: pipe-delimited rows whose first line is the header."""
+
+
+_cached_system: tuple[int, str] | None = None
 
 
 def _get_system_prompt() -> str:
-    """Build the full system prompt with school-specific context."""
-    school_context = school_config.get_school_prompt_context()
-    return f"{SYSTEM_PROMPT_BASE}\n\nSchool Context:\n{school_context}"
+    """Build the full system prompt with school-specific context. Cached per school version."""
+    global _cached_system
+    version = school_config.get_version()
+    if _cached_system is None or _cached_system[0] != version:
+        school_context = school_config.get_school_prompt_context()
+        _cached_system = (version, f"{SYSTEM_PROMPT_BASE}\n\nSchool Context:\n{school_context}")
+    return _cached_system[1]
+
+
+@lru_cache(maxsize=8)
+def _compose_system(school_version: int, profile_context: str) -> str:
+    """Combine the school system prompt with profile context."""
+    system_content = _get_system_prompt()
+    if profile_context:
+        system_content += f"\n\nUser Profile:\n{profile_context}"
+    return system_content
 
 
 async def process_message(text: str, ws, llm_provider, hardware) -> None:
     """
     Main conversation pipeline. Steps 1-11 from the spec.
+    LLM output is streamed and spoken sentence-by-sentence as it arrives.
     """
-    try:
-        # Step 1: Send thinking state via WS
-        await _send_ws(ws, {"type": "assistant_state", "state": "thinking"})
+    tts_queue: asyncio.Queue = asyncio.Queue()
+    speech = _SpeechState(ws, hardware)
+    speaker_task = asyncio.create_task(_speak_sentences(speech, tts_queue))
 
-        # Step 2: Set hardware LED to thinking
-        await hardware.set_led_state("thinking")
+    try:
+        # Steps 1-2: Send thinking state via WS and set hardware LED together
+        await asyncio.gather(
+            _send_state(ws, "thinking"),
+            hardware.set_led_state("thinking"),
+        )
 
         # Step 3: Retrieve user profile context
-        profile_context = profile_store.get_profile_context()
+        profile_context = await asyncio.to_thread(profile_store.get_profile_context)
 
         # Step 4: Build messages array
         messages = _build_messages(text, profile_context)
 
-        # Step 5: Call LLM with tools
-        response = await llm_provider.chat(messages, tools=TOOL_DEFINITIONS)
+        # Step 5: Stream LLM reply with tools; finished sentences go straight to TTS
+        response_text, tool_calls = await _stream_reply(
+            llm_provider.stream_chat(messages, tools=TOOL_DEFINITIONS),
+            tts_queue,
+        )
 
         # Step 6: Handle tool calls if returned
         tool_results_summary = []
-        tool_calls = response.get("tool_calls", [])
+        history_text = None
 
         if tool_calls:
             # Limit to MAX_TOOL_CALLS_PER_TURN
             tool_calls = tool_calls[:MAX_TOOL_CALLS_PER_TURN]
 
-            for tool_call in tool_calls:
-                tool_name = tool_call.get("function", {}).get("name", "")
-                raw_args = tool_call.get("function", {}).get("arguments", {})
-
-                # Parse arguments if they're a string
-                if isinstance(raw_args, str):
-                    try:
-                        tool_args = json.loads(raw_args)
-                    except json.JSONDecodeError:
-                        tool_args = {}
-                else:
-                    tool_args = raw_args
-
-                # Step 6a: Send tool_status calling
-                await _send_ws(ws, {
-                    "type": "tool_status",
-                    "tool": tool_name,
-                    "status": "calling",
-                })
-
-                # Step 6b: Execute tool
-                tool_result = await tools_module.execute_tool(tool_name, tool_args)
-
-                # Step 6c: Send tool_status done
-                status = "done" if tool_result.get("ok") else "error"
-                await _send_ws(ws, {
-                    "type": "tool_status",
-                    "tool": tool_name,
-                    "status": status,
-                })
-
+            # Parse all arguments up front so independent tools can run together
+            parsed_calls = [
+                (tool_call, tool_call.get("function", {}).get("name", ""), _parse_tool_args(tool_call))
+                for tool_call in tool_calls
+            ]
+
+            # A spoken preamble may have switched to speaking; tools run in thinking
+            await speech.hold()
+
+            # Steps 6a-6b: Send tool_status calling while the tools execute
+            *_, tool_results = await asyncio.gather(
+                *(
+                    _send_tool_status(ws, tool_name, "calling")
+                    for _, tool_name, _ in parsed_calls
+                ),
+                tools_module.execute_tools([(tool_name, tool_args) for _, tool_name, tool_args in parsed_calls]),
+            )
+
+            # Step 6c: Send tool_status done/error for each tool
+            await asyncio.gather(*(
+                _send_tool_status(ws, tool_name, "done" if tool_result.get("ok") else "error")
+                for (_, tool_name, _), tool_result in zip(parsed_calls, tool_results)
+            ))
+
+            for (tool_call, tool_name, _), tool_result in zip(parsed_calls, tool_results):
                 # Step 6d: Append tool result to messages
                 messages.append({
                     "role": "assistant",
@@ -107,26 +162,48 @@ async def process_message(text: str, ws, llm_provider, hardware) -> None:
                 })
                 messages.append({
                     "role": "tool",
-                    "content": json.dumps(tool_result),
+                    "content": tools_module.format_tool_result(tool_result),
                 })
 
                 # Build summary for frontend
-                tool_results_summary.append({
+                summary = {
                     "tool": tool_name,
                     "summary": _summarize_tool_result(tool_name, tool_result),
-                })
-
-            # Step 6e: Call LLM again without tools for final response
-            response = await llm_provider.chat(messages, tools=None)
+                }
+                if tool_result.get("ok") and tool_result.get("url"):
+                    summary["url"] = tool_result["url"]
+                tool_results_summary.append(summary)
+
+            # The reply itself starts now (terminal template or final stream)
+            await speech.release()
+
+            if all(
+                tool_name in _TERMINAL_REPLIES and tool_result.get("ok")
+                for (_, tool_name, _), tool_result in zip(parsed_calls, tool_results)
+            ):
+                # Step 6e (shortcut): Results are directly speakable, skip the second LLM call
+                reply = " ".join(
+                    _TERMINAL_REPLIES[tool_name](tool_args, tool_result)
+                    for (_, tool_name, tool_args), tool_result in zip(parsed_calls, tool_results)
+                )
+                tts_queue.put_nowait(reply)
+                response_text = f"{response_text} {reply}".strip()
+                # The templates leave out IDs and URLs; keep them in history for follow-up turns
+                history_text = "\n".join(
+                    [response_text, *(f"[{item['tool']}: {item['summary']}]" for item in tool_results_summary)]
+                )
+            else:
+                # Step 6e: Stream the final response without tools, after any spoken preamble
+                response_text, _ = await _stream_reply(
+                    llm_provider.stream_chat(messages, tools=None),
+                    tts_queue,
+                    response_text,
+                )
 
-        # Extract response text
-        response_text = response.get("content", "")
         if not response_text:
             response_text = "I'm sorry, I couldn't generate a response. Could you try asking again?"
-        elif len(response_text) > MAX_RESPONSE_CHARS:
-            response_text = response_text[:MAX_RESPONSE_CHARS].rstrip()
-            if not response_text.endswith(('.', '!', '?')):
-                response_text += "..."
+            tts_queue.put_nowait(response_text)
+        tts_queue.put_nowait(None)
 
         # Step 7: Send assistant_text via WS
         text_msg = {"type": "assistant_text", "text": response_text}
@@ -136,53 +213,169 @@ async def process_message(text: str, ws, llm_provider, hardware) -> None:
 
         # Update chat history
         _chat_history.append({"role": "user", "content": text})
-        _chat_history.append({"role": "assistant", "content": response_text})
-        # Trim history to last MAX_HISTORY messages
-        while len(_chat_history) > MAX_HISTORY:
-            _chat_history.pop(0)
+        _chat_history.append({"role": "assistant", "content": history_text or response_text})
 
-        # Step 8: Generate TTS audio
-        audio_path = await elevenlabs_tts.synthesize(response_text)
+        # Steps 8-11: Let the remaining sentence audio finish
+        await speaker_task
+
+    except Exception as e:
+        print(f"[BRAIN] Error processing message: {e}")
+        speaker_task.cancel()
+        await asyncio.gather(
+            _send_ws(ws, {
+                "type": "error",
+                "message": str(e),
+                "recoverable": True,
+            }),
+            _send_state(ws, "idle"),
+            hardware.set_led_state("idle"),
+        )
+    finally:
+        # Don't leave synthesis running if the turn is interrupted
+        if not speaker_task.done():
+            speaker_task.cancel()
+
+
+def _parse_tool_args(tool_call: dict) -> dict:
+    """Extract tool arguments, parsing them if they're a JSON string."""
+    raw_args = tool_call.get("function", {}).get("arguments", {})
+    if isinstance(raw_args, str):
+        try:
+            return orjson.loads(raw_args)
+        except orjson.JSONDecodeError:
+            return {}
+    return raw_args
+
+
+async def _stream_reply(stream, tts_queue: asyncio.Queue, text: str = "") -> tuple[str, list]:
+    """
+    Consume an LLM delta stream, appending to text and queueing each completed
+    sentence for TTS. Stops reading once MAX_RESPONSE_CHARS is reached.
+    Returns (text, tool_calls).
+    """
+    tool_calls = []
+    if text:
+        text += " "
+    spoken = len(text)
+    truncated = False
 
-        if audio_path:
-            # Step 9: Send assistant_audio_ready via WS
-            # Convert file path to API URL
-            filename = audio_path.split("/")[-1]
-            audio_url = f"/api/audio/tts/{filename}"
-            await _send_ws(ws, {
-                "type": "assistant_audio_ready",
-                "audio_url": audio_url,
-                "format": "mp3",
-            })
+    try:
+        async for delta in stream:
+            tool_calls.extend(delta.get("tool_calls") or [])
+            text += delta.get("content") or ""
+            if len(text) > MAX_RESPONSE_CHARS:
+                text = _clip_response(text)
+                truncated = True
 
-        # Step 10: Send speaking state
-        await _send_ws(ws, {"type": "assistant_state", "state": "speaking"})
+            while match := _SENTENCE_END.search(text, spoken):
+                tts_queue.put_nowait(text[spoken:match.end()].strip())
+                spoken = match.end()
 
-        # Step 11: Set hardware LED to speaking
-        await hardware.set_led_state("speaking")
+            if truncated:
+                break
+    finally:
+        await stream.aclose()
 
-    except Exception as e:
-        print(f"[BRAIN] Error processing message: {e}")
-        await _send_ws(ws, {
-            "type": "error",
-            "message": str(e),
-            "recoverable": True,
+    # Flush the trailing sentence (no whitespace after its punctuation yet)
+    tail = text[spoken:].strip()
+    if tail:
+        tts_queue.put_nowait(tail)
+
+    return text.strip(), tool_calls
+
+
+def _clip_response(text: str) -> str:
+    """
+    Cut text to MAX_RESPONSE_CHARS, preferring the last sentence boundary
+    near the limit over a mid-sentence cut with an ellipsis.
+    """
+    cut = text[:MAX_RESPONSE_CHARS]
+    i = max(cut.rfind('.'), cut.rfind('!'), cut.rfind('?'))
+    if i >= MAX_RESPONSE_CHARS - 80:
+        return cut[:i + 1]
+    return cut.rstrip() + "..."
+
+
+class _SpeechState:
+    """
+    Speaking state for one turn. Speaking starts with the first clip, but is held
+    back while tools run so their tool_status frames arrive during thinking.
+    """
+
+    def __init__(self, ws, hardware):
+        self.ws = ws
+        self.hardware = hardware
+        self.speaking = False
+        self.held = False
+        self.audio_sent = False
+
+    async def clip_sent(self) -> None:
+        self.audio_sent = True
+        if not self.held and not self.speaking:
+            self.speaking = True
+            await _set_speaking(self.ws, self.hardware)
+
+    async def hold(self) -> None:
+        self.held = True
+        if self.speaking:
+            self.speaking = False
+            await asyncio.gather(
+                _send_state(self.ws, "thinking"),
+                self.hardware.set_led_state("thinking"),
+            )
+
+    async def release(self) -> None:
+        self.held = False
+        if self.audio_sent and not self.speaking:
+            self.speaking = True
+            await _set_speaking(self.ws, self.hardware)
+
+
+async def _speak_sentences(speech: _SpeechState, tts_queue: asyncio.Queue) -> None:
+    """Synthesize queued sentences in order, announcing each clip with a sequence number."""
+    seq = 0
+    while (sentence := await tts_queue.get()) is not None:
+        # Step 8: Generate TTS audio
+        audio_path = await elevenlabs_tts.synthesize(sentence)
+        if not audio_path:
+            continue
+
+        # Step 9: Send assistant_audio_ready via WS
+        # Convert file path to API URL
+        filename = audio_path.split("/")[-1]
+        audio_url = f"/api/audio/tts/{filename}"
+        await _send_ws(speech.ws, {
+            "type": "assistant_audio_ready",
+            "audio_url": audio_url,
+            "format": "mp3",
+            "seq": seq,
         })
-        await _send_ws(ws, {"type": "assistant_state", "state": "idle"})
-        await hardware.set_led_state("idle")
+
+        # Steps 10-11: Speaking starts with the first clip of the reply
+        await speech.clip_sent()
+        seq += 1
+
+    if seq == 0:
+        # No audio (TTS disabled or failed): frontend speaks the text itself
+        await _set_speaking(speech.ws, speech.hardware)
+
+
+async def _set_speaking(ws, hardware) -> None:
+    """Send speaking state and set hardware LED together."""
+    await asyncio.gather(
+        _send_state(ws, "speaking"),
+        hardware.set_led_state("speaking"),
+    )
 
 
 def _build_messages(user_text: str, profile_context: str) -> list[dict]:
     """Build the messages array for the LLM call."""
-    system_content = _get_system_prompt()
-    if profile_context:
-        system_content += f"\n\nUser Profile:\n{profile_context}"
+    system_content = _compose_system(school_config.get_version(), profile_context)
 
     messages = [{"role": "system", "content": system_content}]
 
     # Add chat history
-    for msg in _chat_history:
-        messages.append(msg)
+    messages.extend(_chat_history)
 
     # Add current user message
     messages.append({"role": "user", "content": user_text})
@@ -190,47 +383,62 @@ def _build_messages(user_text: str, profile_context: str) -> list[dict]:
     return messages
 
 
+def _plural(count: int, noun: str) -> str:
+    return f"{count} {noun}{'s' if count != 1 else ''}"
+
+
+_SUMMARIZERS = {
+    "get_events": lambda r: f"Found {_plural(len(r.get('events', [])), 'event')}",
+    "get_recommendations": lambda r: f"Found {_plural(len(r.get('events', [])), 'recommendation')}",
+    "get_calendar_summary": lambda r: f"Found {_plural(len(r.get('events', [])), 'upcoming item')}",
+    "add_calendar_item": lambda r: f"Added to calendar (ID: {r.get('id', '?')})",
+    "start_study_session": lambda r: f"Started study session {r.get('session_id', '?')} until {r.get('end_time', '?')}",
+    "stop_study_session": lambda r: f"Session ended after {r.get('elapsed_min', '?')} minutes",
+    "spotify_search_link": lambda r: f"Spotify link: {r.get('url', '?')}",
+}
+
+
 def _summarize_tool_result(tool_name: str, result: dict) -> str:
     """Generate a brief summary of a tool result for the frontend."""
     if not result.get("ok"):
         return f"{tool_name} failed: {result.get('error', 'unknown error')}"
 
-    if tool_name == "get_events":
-        count = len(result.get("events", []))
-        return f"Found {count} event{'s' if count != 1 else ''}"
+    summarizer = _SUMMARIZERS.get(tool_name)
+    return summarizer(result) if summarizer else "Done"
 
-    if tool_name == "get_recommendations":
-        count = len(result.get("events", []))
-        return f"Found {count} recommendation{'s' if count != 1 else ''}"
 
-    if tool_name == "get_calendar_summary":
-        count = len(result.get("events", []))
-        return f"Found {count} upcoming item{'s' if count != 1 else ''}"
-
-    if tool_name == "add_calendar_item":
-        return f"Added to calendar (ID: {result.get('id', '?')})"
+async def _send_ws(ws, data: dict) -> None:
+    """Send a JSON message over WebSocket, with error handling."""
+    await _send_frame(ws, orjson.dumps(data).decode())
 
-    if tool_name == "start_study_session":
-        return f"Started study session until {result.get('end_time', '?')}"
 
-    if tool_name == "stop_study_session":
-        return f"Session ended after {result.get('elapsed_min', '?')} minutes"
+async def _send_state(ws, state: str) -> None:
+    """Send a pre-encoded assistant_state frame."""
+    await _send_frame(ws, _STATE_FRAMES[state])
 
-    if tool_name == "spotify_search_link":
-        return f"Spotify link generated"
 
-    return "Done"
+async def _send_tool_status(ws, tool_name: str, status: str) -> None:
+    """Send a tool_status frame, pre-encoded for known tools."""
+    frame = _TOOL_STATUS_FRAMES.get((tool_name, status))
+    if frame is None:
+        frame = orjson.dumps({"type": "tool_status", "tool": tool_name, "status": status}).decode()
+    await _send_frame(ws, frame)
 
 
-async def _send_ws(ws, data: dict) -> None:
-    """Send a JSON message over WebSocket, with error handling."""
+async def _send_frame(ws, frame: str) -> None:
+    """
+    Send an already-encoded JSON text frame, with error handling.
+    After the first failure the socket is marked dead and later sends are skipped.
+    """
+    if getattr(ws, "_vuddy_dead", False):
+        return
     try:
-        await ws.send_json(data)
+        await ws.send_text(frame)
     except Exception as e:
-        print(f"[BRAIN] Failed to send WS message: {e}")
+        ws._vuddy_dead = True
+        print(f"[BRAIN] Failed to send WS message, skipping further sends: {e}")
 
 
 def clear_history() -> None:
     """Clear chat history (e.g., on new connection)."""
-    global _chat_history
-    _chat_history = []
+    _chat_history.clear()
@@ -4,7 +4,10 @@ Loads from data/fixtures/calendar.json as default.
 Optional Google Calendar API (Phase 2).
 """
 
-import json
+import asyncio
+import bisect
+import contextlib
+import heapq
 import os
 import uuid
 import time
@@ -12,21 +15,51 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from urllib.parse import quote, urlencode
 import httpx
+import orjson
 
 CALENDAR_FILE = os.getenv("CALENDAR_FILE", os.path.join("data", "calendar.json"))
 GOOGLE_OAUTH_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_OAUTH_SCOPE = "https://www.googleapis.com/auth/calendar.readonly"
 OAUTH_STATE_TTL_SEC = 600
+# Coalesce bursts of calendar writes into one disk write per window
+CALENDAR_FLUSH_DELAY_SEC = 0.2
 
 _calendar_cache: list[dict] | None = None
+# Events with a parseable start, sorted by start (UTC). Rebuilt lazily after saves.
+_calendar_index: list[tuple[datetime, dict]] | None = None
 _oauth_states: dict[str, float] = {}
+# Min-heap of (expiry, state) so cleanup only touches expired entries
+_state_expiry_heap: list[tuple[float, str]] = []
+_calendar_dirty = False
+_flush_task: asyncio.Task | None = None
+_http: httpx.AsyncClient | None = None
 
 
 def _env(name: str) -> str:
     return os.getenv(name, "").strip()
 
 
+def _get_http() -> httpx.AsyncClient:
+    """Shared Google API client: keeps connections (and HTTP/2 sessions) alive across calls."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+    return _http
+
+
+async def close_http() -> None:
+    """Close the shared Google API client. Call at shutdown."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
 def _load_calendar() -> list[dict]:
     """Load calendar events from fixture file. Cached after first load."""
     global _calendar_cache
@@ -34,25 +67,134 @@ def _load_calendar() -> list[dict]:
         return _calendar_cache
 
     try:
-        with open(CALENDAR_FILE, "r") as f:
-            _calendar_cache = json.load(f)
+        with open(CALENDAR_FILE, "rb") as f:
+            _calendar_cache = orjson.loads(f.read())
     except FileNotFoundError:
         print(f"[CALENDAR] File not found at {CALENDAR_FILE}, using empty list")
         _calendar_cache = []
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"[CALENDAR] Invalid JSON in {CALENDAR_FILE}: {e}")
         _calendar_cache = []
 
+    # Parse start times once; private keys are stripped again on save
+    for event in _calendar_cache:
+        event["_start_dt"] = _try_parse_event_datetime(event.get("start"))
+
     return _calendar_cache
 
 
+def _get_calendar_index() -> list[tuple[datetime, dict]]:
+    """Return calendar events paired with parsed start times, sorted by start."""
+    global _calendar_index
+    if _calendar_index is not None:
+        return _calendar_index
+
+    index = []
+    for event in _load_calendar():
+        if "_start_dt" not in event:
+            event["_start_dt"] = _try_parse_event_datetime(event.get("start"))
+        if event["_start_dt"] is not None:
+            index.append((event["_start_dt"], event))
+    index.sort(key=lambda item: item[0])
+    _calendar_index = index
+    return _calendar_index
+
+
 def _save_calendar(events: list[dict]) -> None:
-    """Persist calendar events to the fixture file."""
-    global _calendar_cache
+    """
+    Update the in-memory calendar and schedule a debounced write to disk.
+    Writes immediately when no event loop is running.
+    """
+    global _calendar_cache, _calendar_index, _calendar_dirty, _flush_task
     _calendar_cache = events
+    _calendar_index = None
+    _calendar_dirty = True
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush_calendar()
+        return
+
+    if _flush_task is None:
+        _flush_task = loop.create_task(_flush_worker())
+
+
+async def _flush_worker() -> None:
+    """Write pending changes once per debounce window, off the event loop."""
+    global _calendar_dirty, _flush_task
+    try:
+        while _calendar_dirty:
+            await asyncio.sleep(CALENDAR_FLUSH_DELAY_SEC)
+            payload = _encode_pending()
+            try:
+                await asyncio.to_thread(_write_calendar_file, payload)
+            except OSError as e:
+                print(f"[CALENDAR] Failed to write {CALENDAR_FILE}: {e}")
+                _calendar_dirty = True
+                break
+    finally:
+        _flush_task = None
+
+
+async def aflush_calendar() -> None:
+    """
+    Write pending calendar changes before exit. Call at async shutdown.
+    Waits for an in-flight flush rather than cancelling it: cancelling doesn't stop
+    a write already running in its worker thread.
+    """
+    global _calendar_dirty
+    if _flush_task is not None:
+        await _flush_task
+    if not _calendar_dirty or _calendar_cache is None:
+        return
+
+    try:
+        await asyncio.to_thread(_write_calendar_file, _encode_pending())
+    except OSError as e:
+        print(f"[CALENDAR] Failed to write {CALENDAR_FILE}: {e}")
+        _calendar_dirty = True
+
+
+def flush_calendar() -> None:
+    """Write pending calendar changes to disk synchronously, when no event loop is running."""
+    global _calendar_dirty, _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        _flush_task = None
+    if not _calendar_dirty or _calendar_cache is None:
+        return
+
+    try:
+        _write_calendar_file(_encode_pending())
+    except OSError as e:
+        print(f"[CALENDAR] Failed to write {CALENDAR_FILE}: {e}")
+        _calendar_dirty = True
+
+
+def _encode_pending() -> bytes:
+    """Snapshot the calendar for writing (private keys stripped) and clear the dirty flag."""
+    global _calendar_dirty
+    _calendar_dirty = False
+    return orjson.dumps(
+        [{k: v for k, v in event.items() if not k.startswith("_")} for event in _calendar_cache or []],
+        option=orjson.OPT_INDENT_2,
+    )
+
+
+def _write_calendar_file(payload: bytes) -> None:
+    """Write to a temp file and atomically swap it into place."""
+    # Unique per write so overlapping writers never share (or remove) each other's temp file
+    tmp_path = f"{CALENDAR_FILE}.{os.getpid()}-{uuid.uuid4().hex}.tmp"
     os.makedirs(os.path.dirname(CALENDAR_FILE), exist_ok=True)
-    with open(CALENDAR_FILE, "w") as f:
-        json.dump(events, f, indent=2)
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, CALENDAR_FILE)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
 
 def get_summary(hours_ahead: int = 24) -> dict:
@@ -61,29 +203,25 @@ def get_summary(hours_ahead: int = 24) -> dict:
     Returns: {ok: bool, events: [{title, start, end}]}
     """
     try:
-        events = _load_calendar()
+        index = _get_calendar_index()
         now = datetime.now(timezone.utc)
         cutoff = now + timedelta(hours=hours_ahead)
 
-        upcoming = []
-        for event in events:
-            try:
-                event_start = _parse_event_datetime(event["start"])
-            except (ValueError, KeyError, TypeError):
-                continue
-
-            if now <= event_start <= cutoff:
-                upcoming.append({
-                    "id": event.get("id", ""),
-                    "title": event.get("title", ""),
-                    "start": event.get("start", ""),
-                    "end": event.get("end", ""),
-                    "location": event.get("location", ""),
-                    "source": event.get("source", ""),
-                })
-
-        # Sort by start time
-        upcoming.sort(key=lambda e: e["start"])
+        # Index is sorted by start time: binary-search the [now, cutoff] window
+        lo = bisect.bisect_left(index, now, key=lambda item: item[0])
+        hi = bisect.bisect_right(index, cutoff, lo=lo, key=lambda item: item[0])
+
+        upcoming = [
+            {
+                "id": event.get("id", ""),
+                "title": event.get("title", ""),
+                "start": event.get("start", ""),
+                "end": event.get("end", ""),
+                "location": event.get("location", ""),
+                "source": event.get("source", ""),
+            }
+            for _, event in index[lo:hi]
+        ]
 
         return {"ok": True, "events": upcoming}
 
@@ -166,44 +304,52 @@ async def import_google_calendar(
         params["key"] = google_calendar_api_key
 
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            response = await client.get(url, params=params, headers=headers)
+        response = await _get_http().get(url, params=params, headers=headers, timeout=8.0)
         response.raise_for_status()
-        payload = response.json()
+        payload = orjson.loads(response.content)
         items = payload.get("items", [])
     except Exception as e:
         return {"ok": False, "imported": 0, "error": f"Google import failed: {e}"}
 
     events = _load_calendar()
     existing_ids = {evt.get("id") for evt in events}
-    imported = 0
 
-    for item in items:
-        start = item.get("start", {}).get("dateTime") or item.get("start", {}).get("date")
-        end = item.get("end", {}).get("dateTime") or item.get("end", {}).get("date") or start
-        if not start:
-            continue
+    # Key incoming items by local ID once, then keep only unseen, dated ones
+    by_id = {f"gcal_{item.get('id') or uuid.uuid4().hex[:8]}": item for item in items}
+    new_events = [
+        event
+        for event in (
+            _from_google_item(event_id, item)
+            for event_id, item in by_id.items()
+            if event_id not in existing_ids
+        )
+        if event
+    ]
+
+    if new_events:
+        events.extend(new_events)
+        _save_calendar(events)
 
-        event_id = f"gcal_{item.get('id', uuid.uuid4().hex[:8])}"
-        if event_id in existing_ids:
-            continue
+    return {"ok": True, "imported": len(new_events), "events_seen": len(items)}
 
-        events.append({
-            "id": event_id,
-            "title": item.get("summary", "Google Calendar Event"),
-            "start": start,
-            "end": end,
-            "notes": item.get("description", ""),
-            "location": item.get("location", ""),
-            "source": "google",
-        })
-        existing_ids.add(event_id)
-        imported += 1
-
-    if imported:
-        _save_calendar(events)
 
-    return {"ok": True, "imported": imported, "events_seen": len(items)}
+def _from_google_item(event_id: str, item: dict) -> dict | None:
+    """Convert a Google Calendar API item to a local event. None if it has no start."""
+    start_info = item.get("start") or {}
+    end_info = item.get("end") or {}
+    start = start_info.get("dateTime") or start_info.get("date")
+    if not start:
+        return None
+
+    return {
+        "id": event_id,
+        "title": item.get("summary", "Google Calendar Event"),
+        "start": start,
+        "end": end_info.get("dateTime") or end_info.get("date") or start,
+        "notes": item.get("description", ""),
+        "location": item.get("location", ""),
+        "source": "google",
+    }
 
 
 def get_google_oauth_url(redirect_uri: str = "") -> dict:
@@ -219,7 +365,9 @@ def get_google_oauth_url(redirect_uri: str = "") -> dict:
         return {"ok": False, "error": "Missing redirect URI"}
 
     state = secrets.token_urlsafe(24)
-    _oauth_states[state] = time.time() + OAUTH_STATE_TTL_SEC
+    expiry = time.time() + OAUTH_STATE_TTL_SEC
+    _oauth_states[state] = expiry
+    heapq.heappush(_state_expiry_heap, (expiry, state))
     _cleanup_oauth_states()
 
     params = {
@@ -269,10 +417,9 @@ async def exchange_google_oauth_code(code: str, state: str, redirect_uri: str =
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(GOOGLE_OAUTH_TOKEN_URL, data=payload)
+        response = await _get_http().post(GOOGLE_OAUTH_TOKEN_URL, data=payload)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         access_token = (data.get("access_token") or "").strip()
         if not access_token:
             return {"ok": False, "error": "Google token response missing access_token"}
@@ -289,9 +436,19 @@ def _is_valid_oauth_state(state: str) -> bool:
 
 def _cleanup_oauth_states() -> None:
     now = time.time()
-    expired = [key for key, expiry in _oauth_states.items() if expiry < now]
-    for key in expired:
-        _oauth_states.pop(key, None)
+    while _state_expiry_heap and _state_expiry_heap[0][0] < now:
+        expiry, state = heapq.heappop(_state_expiry_heap)
+        # Skip heap entries for states already consumed or re-issued
+        if _oauth_states.get(state) == expiry:
+            del _oauth_states[state]
+
+
+def _try_parse_event_datetime(raw_value) -> datetime | None:
+    """Like _parse_event_datetime, but returns None for missing or malformed values."""
+    try:
+        return _parse_event_datetime(raw_value)
+    except (ValueError, TypeError, AttributeError):
+        return None
 
 
 def _parse_event_datetime(raw_value: str) -> datetime:
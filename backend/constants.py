@@ -1,17 +1,22 @@
 """
 Vuddy Backend — Frozen Enum Constants.
 Import these everywhere instead of using raw strings.
+Tuples keep declaration order; the *_SET frozensets are for membership checks.
 """
 
-ASSISTANT_STATES = ["idle", "listening", "thinking", "speaking", "error"]
+ASSISTANT_STATES = ("idle", "listening", "thinking", "speaking", "error")
+ASSISTANT_STATES_SET = frozenset(ASSISTANT_STATES)
 
-LED_MODES = ["pulse", "solid", "breathe", "off"]
+LED_MODES = ("pulse", "solid", "breathe", "off")
+LED_MODES_SET = frozenset(LED_MODES)
 
-LLM_PROVIDERS = ["ollama", "patriotai"]
+LLM_PROVIDERS = ("ollama", "patriotai")
+LLM_PROVIDERS_SET = frozenset(LLM_PROVIDERS)
 
-HARDWARE_MODES = ["sim", "arduino"]
+HARDWARE_MODES = ("sim", "arduino")
+HARDWARE_MODES_SET = frozenset(HARDWARE_MODES)
 
-TOOL_NAMES = [
+TOOL_NAMES = (
     "get_events",
     "get_recommendations",
     "get_calendar_summary",
@@ -19,20 +24,23 @@ TOOL_NAMES = [
     "start_study_session",
     "stop_study_session",
     "spotify_search_link",
-]
+)
+TOOL_NAMES_SET = frozenset(TOOL_NAMES)
 
-WS_TYPES_OUT = [
+WS_TYPES_OUT = (
     "assistant_text",
     "assistant_audio_ready",
     "assistant_state",
     "tool_status",
     "error",
-]
+)
+WS_TYPES_OUT_SET = frozenset(WS_TYPES_OUT)
 
-WS_TYPES_IN = [
+WS_TYPES_IN = (
     "start_listening",
     "stop_listening",
     "transcript_final",
     "chat",
     "interrupt",
-]
+)
+WS_TYPES_IN_SET = frozenset(WS_TYPES_IN)
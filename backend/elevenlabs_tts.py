@@ -3,17 +3,48 @@ Vuddy Backend — ElevenLabs TTS Voice Generation.
 Caches audio by content hash. Graceful fallback on API failure.
 """
 
+import asyncio
+import contextlib
 import hashlib
+import logging
 import os
 import time
+from collections import OrderedDict
 
+import aiofiles
 import httpx
 
+log = logging.getLogger("vuddy.tts")
+
 TTS_OUTPUT_DIR = os.path.join("data", "audio", "tts")
 
 # Max text length — truncate if longer
 MAX_TEXT_LENGTH = 500
 
+# In-process LRU of (voice_id, normalized text) -> cached file path; skips re-hashing repeats
+_TTS_PATH_CACHE_MAX = 512
+_tts_path_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+# Cache files this process has written or already stat'ed; lets repeat hits skip the syscall
+_known_files: set[str] = set()
+
+_http: httpx.AsyncClient | None = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    """Shared ElevenLabs client so repeat requests reuse the keep-alive connection."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=20))
+    return _http
+
+
+async def close_http() -> None:
+    """Close the shared ElevenLabs client. Call at shutdown."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
 
 def _tts_enabled() -> bool:
     raw = os.getenv("ENABLE_TTS", "true").strip().lower()
@@ -39,7 +70,7 @@ async def synthesize(text: str, force_new: bool = False) -> str | None:
     Returns file path on success, None on failure (frontend uses browser speechSynthesis as backup).
     """
     if not _tts_enabled():
-        print("[TTS] ENABLE_TTS is disabled, skipping synthesis")
+        log.debug("ENABLE_TTS is disabled, skipping synthesis")
         return None
 
     if not text or not text.strip():
@@ -55,71 +86,121 @@ async def synthesize(text: str, force_new: bool = False) -> str | None:
 
     # Normalize only for cache key (preserve original text for actual synthesis).
     cache_text = " ".join(text.strip().split())
-
-    # Cache key: SHA-256 of voice_id + text
-    cache_key = hashlib.sha256(f"{voice_id}{cache_text}".encode()).hexdigest()[:16]
+    memo_key = (voice_id, cache_text)
+
+    if not force_new:
+        hit = _tts_path_cache.get(memo_key)
+        if hit and (hit in _known_files or await asyncio.to_thread(os.path.exists, hit)):
+            _tts_path_cache.move_to_end(memo_key)
+            log.debug("Cache hit -> %s", hit)
+            return hit
+
+    # Cache key: 64-bit BLAKE2b of voice_id + text (same 16-hex width as the old SHA-256 prefix)
+    key_source = f"{voice_id}{cache_text}".encode()
+    cache_key = hashlib.blake2b(key_source, digest_size=8).hexdigest()
     filename = f"{cache_key}.mp3"
     filepath = os.path.join(TTS_OUTPUT_DIR, filename)
 
     # Cache hit: return path immediately
-    if not force_new and os.path.exists(filepath):
-        print(f"[TTS] Cache hit -> {filepath}")
-        return filepath
+    if not force_new:
+        if filepath in _known_files:
+            hit = filepath
+        else:
+            hit = await asyncio.to_thread(_find_cached_file, filepath, key_source)
+        if hit:
+            _known_files.add(hit)
+            log.debug("Cache hit -> %s", hit)
+            _remember_path(memo_key, hit)
+            return hit
 
     if force_new:
         filename = f"{cache_key}_{int(time.time())}.mp3"
         filepath = os.path.join(TTS_OUTPUT_DIR, filename)
 
     # Ensure output directory exists
-    os.makedirs(TTS_OUTPUT_DIR, exist_ok=True)
+    await asyncio.to_thread(os.makedirs, TTS_OUTPUT_DIR, exist_ok=True)
 
     if not api_key:
-        print("[TTS] No ElevenLabs API key set, returning None (text-only fallback)")
+        log.info("No ElevenLabs API key set, returning None (text-only fallback)")
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": api_key,
-            }
-            payload = {
-                "text": text,
-                "model_id": model_id,
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.75,
-                },
-            }
-            resp = await client.post(url, json=payload, headers=headers)
-
+        client = _get_http()
+        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+        headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": api_key,
+        }
+        payload = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.75,
+            },
+        }
+        async with client.stream("POST", url, json=payload, headers=headers) as resp:
             if resp.status_code != 200:
-                # Log the actual error from ElevenLabs for debugging
-                try:
-                    error_body = resp.json()
-                except Exception:
-                    error_body = resp.text[:300]
-                print(f"[TTS] ElevenLabs {resp.status_code} error:")
-                print(f"[TTS]   Response: {error_body}")
-                if resp.status_code == 401:
-                    print(f"[TTS]   Key length: {len(api_key)}, starts with: {api_key[:6]}...")
-                    print(f"[TTS]   Check: is the key correct? No quotes in .env?")
+                # Log the start of the error body; large HTML error pages are never read in full
+                error_head = await _read_head(resp, 512)
+                log.warning("ElevenLabs %s error: %s", resp.status_code, error_head.decode("utf-8", "replace"))
+                if resp.status_code == 401 and log.isEnabledFor(logging.DEBUG):
+                    log.debug("  Key length: %d, starts with: %s...", len(api_key), api_key[:6])
+                    log.debug("  Check: is the key correct? No quotes in .env?")
                 return None
 
-            with open(filepath, "wb") as f:
-                f.write(resp.content)
-
-            print(f"[TTS] Synthesized -> {filepath}")
-            return filepath
+            # Stream to a temp file and rename so a crash never leaves a half-written cache entry;
+            # all file I/O runs in worker threads so other sessions keep the loop
+            tmp_path = f"{filepath}.{os.getpid()}-{id(resp):x}.tmp"
+            try:
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    async for chunk in resp.aiter_bytes(65536):
+                        await f.write(chunk)
+                await asyncio.to_thread(os.replace, tmp_path, filepath)
+                _known_files.add(filepath)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    await asyncio.to_thread(os.remove, tmp_path)
+                raise
+
+        log.debug("Synthesized -> %s", filepath)
+        if not force_new:
+            _remember_path(memo_key, filepath)
+        return filepath
 
     except httpx.TimeoutException:
-        print("[TTS] ElevenLabs API timed out (30s), returning None")
+        log.warning("ElevenLabs API timed out (30s), returning None")
         return None
     except httpx.ConnectError as e:
-        print(f"[TTS] Cannot reach ElevenLabs API ({e}), returning None")
+        log.warning("Cannot reach ElevenLabs API (%s), returning None", e)
         return None
     except Exception as e:
-        print(f"[TTS] Unexpected error: {type(e).__name__}: {e}")
+        log.warning("Unexpected error: %s: %s", type(e).__name__, e)
         return None
+
+
+async def _read_head(resp: httpx.Response, limit: int) -> bytes:
+    """Read at most `limit` bytes of a streamed response body."""
+    head = b""
+    async for chunk in resp.aiter_bytes():
+        head += chunk
+        if len(head) >= limit:
+            break
+    return head[:limit]
+
+
+def _find_cached_file(filepath: str, key_source: bytes) -> str | None:
+    """Return filepath if cached, else a file cached under the previous SHA-256 key scheme."""
+    if os.path.exists(filepath):
+        return filepath
+    legacy_key = hashlib.sha256(key_source).hexdigest()[:16]
+    legacy_path = os.path.join(TTS_OUTPUT_DIR, f"{legacy_key}.mp3")
+    return legacy_path if os.path.exists(legacy_path) else None
+
+
+def _remember_path(memo_key: tuple[str, str], filepath: str) -> None:
+    _tts_path_cache[memo_key] = filepath
+    _tts_path_cache.move_to_end(memo_key)
+    if len(_tts_path_cache) > _TTS_PATH_CACHE_MAX:
+        _tts_path_cache.popitem(last=False)
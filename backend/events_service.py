@@ -4,16 +4,34 @@ Loads seeded events from JSON, filters by time range and tags.
 Schema must match shared/events.schema.json.
 """
 
-import json
+import asyncio
+import bisect
 import os
 import re
 import hashlib
-import subprocess
+import heapq
+import io
+import logging
+import math
+import mmap
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
 from html import unescape
-from datetime import datetime, timedelta
-from urllib.parse import parse_qs, unquote, urlparse, urlencode
+from types import MappingProxyType
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from urllib.parse import parse_qs, unquote, urlparse
 from zoneinfo import ZoneInfo
 import httpx
+import orjson
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional; regex extraction below covers it
+    HTMLParser = None
+
+log = logging.getLogger("vuddy.events")
 
 EVENTS_DATA_PATH = os.getenv("EVENTS_DATA_PATH", os.path.join("data", "events_seed.json"))
 TICKETMASTER_API_KEY = os.getenv("TICKETMASTER_API_KEY", "")
@@ -22,9 +40,57 @@ DUCKDUCKGO_HTML_URL = "https://duckduckgo.com/html/"
 GMU_ICS_URL = os.getenv("GMU_ICS_URL", "https://mason360.gmu.edu/ical/gmu/ical_gmu.ics")
 US_EASTERN = ZoneInfo("America/New_York")
 EVENTS_CACHE_TTL_SEC = int(os.getenv("EVENTS_CACHE_TTL_SEC", "900"))
+# After the TTL, entries are served stale for this long while a background refresh runs
+EVENTS_CACHE_STALE_SEC = int(os.getenv("EVENTS_CACHE_STALE_SEC", "300"))
+_REALTIME_CACHE_MAX = 512
+# Shared read-only stand-in for missing nested objects; avoids allocating `{}` per lookup
+_EMPTY = MappingProxyType({})
+
+_DDG_ANCHOR_RE = re.compile(
+    r'<a[^>]*class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>',
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_DDG_SNIPPET_RE = re.compile(
+    r'<a[^>]*class="result__snippet"[^>]*>(.*?)</a>',
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_STRIP_TAGS_RE = re.compile(r"<[^>]+>")
+_ICS_DATE_RE = re.compile(r"\d{8}")
+_ICS_UTC_RE = re.compile(r"\d{8}T\d{6}Z")
+_ICS_LOCAL_RE = re.compile(r"\d{8}T\d{6}")
+_ICS_TOKEN_RE = re.compile(r"[\W_]+")
+_WORD_SPLIT_RE = re.compile(r"\W+")
+# RFC 5545 TEXT escapes, decoded left to right in one pass
+_ICS_ESCAPE_RE = re.compile(r"\\[nN,;\\]")
+_ICS_ESCAPES = {"\\n": "\n", "\\N": "\n", "\\,": ",", "\\;": ";", "\\\\": "\\"}
+_ICS_FIELDS = frozenset({"SUMMARY", "DTSTART", "DTEND", "LOCATION", "DESCRIPTION", "URL"})
 
 _events_cache: list[dict] | None = None
-_realtime_cache: dict[str, dict] = {}
+# LRU of cache_key -> (monotonic hard expiry, monotonic stale-at, value)
+_realtime_cache: OrderedDict[str, tuple[float, float, dict]] = OrderedDict()
+# Keys with a stale-while-revalidate refresh in flight, and strong refs to those tasks
+_realtime_refreshing: set[str] = set()
+_refresh_tasks: set[asyncio.Task] = set()
+# Min-heap of (expiry, cache_key) so expired entries are purged without scanning the cache
+_realtime_expiry_heap: list[tuple[float, str]] = []
+# Dated seed events sorted by start, with a parallel list of starts for bisect
+_events_by_start: list[dict] = []
+_event_starts: list[datetime] = []
+_max_event_span = timedelta(0)
+# BM25 statistics over seed haystacks (k1/b are the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+_bm25_idf: dict[str, float] = {}
+_bm25_avgdl = 0.0
+# Trigram -> indices of seed events whose search haystack contains it
+_trigram_index: dict[str, set[int]] = {}
+# frozenset(tags) -> ascending indices into _events_by_start sharing at least one tag
+_TAG_QUERY_CACHE_MAX = 64
+_tag_query_cache: dict[frozenset, list[int]] = {}
+# LRU of (named range, sorted tags) -> (wall-clock expiry at window end, get_events result)
+_GET_EVENTS_CACHE_MAX = 64
+_get_events_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_http: httpx.AsyncClient | None = None
 
 
 def _load_events() -> list[dict]:
@@ -34,18 +100,153 @@ def _load_events() -> list[dict]:
         return _events_cache
 
     try:
-        with open(EVENTS_DATA_PATH, "r") as f:
-            _events_cache = json.load(f)
+        _events_cache = _read_seed_file(EVENTS_DATA_PATH)
     except FileNotFoundError:
-        print(f"[EVENTS] Seed file not found at {EVENTS_DATA_PATH}, using empty list")
+        log.warning("Seed file not found at %s, using empty list", EVENTS_DATA_PATH)
         _events_cache = []
-    except json.JSONDecodeError as e:
-        print(f"[EVENTS] Invalid JSON in {EVENTS_DATA_PATH}: {e}")
+    except orjson.JSONDecodeError as e:
+        log.warning("Invalid JSON in %s: %s", EVENTS_DATA_PATH, e)
         _events_cache = []
 
+    _prepare_events(_events_cache)
     return _events_cache
 
 
+def _read_seed_file(path: str) -> list[dict]:
+    """Parse the seed file straight from a read-only mapping, skipping the bytes copy."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file; let orjson report it as invalid JSON
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _prepare_events(events: list[dict]) -> None:
+    """Precompute per-event private fields (underscore keys) and the start-time index."""
+    global _events_by_start, _event_starts, _max_event_span, _trigram_index, _bm25_idf, _bm25_avgdl
+    trigram_index: dict[str, set[int]] = {}
+    doc_freq: Counter[str] = Counter()
+    for i, event in enumerate(events):
+        event["_start_dt"] = _try_fromisoformat(event.get("start"))
+        event["_end_dt"] = _try_fromisoformat(event.get("end"))
+        event["_tag_set"] = frozenset(event.get("tags", []))
+        # Lowercased search fields for _search_seed_events
+        event["_title_lc"] = event.get("title", "").lower()
+        event["_desc_lc"] = event.get("description", "").lower()
+        event["_location_lc"] = event.get("location", "").lower()
+        event["_tags_lc"] = " ".join(event.get("tags", [])).lower()
+        event["_haystack_lc"] = (
+            f"{event['_title_lc']} {event['_desc_lc']} {event['_location_lc']} {event['_tags_lc']}"
+        )
+        # Response projection shared by every get_events call; callers must not mutate it
+        event["_public"] = {
+            "title": event.get("title", ""),
+            "start": event.get("start", ""),
+            "end": event.get("end", ""),
+            "location": event.get("location", ""),
+            "tags": event.get("tags", []),
+            "description": event.get("description", ""),
+        }
+        for gram in _trigrams(event["_haystack_lc"]):
+            trigram_index.setdefault(gram, set()).add(i)
+        # BM25 term statistics for _search_seed_events ranking
+        terms = _tokenize(event["_haystack_lc"])
+        event["_tf"] = Counter(terms)
+        event["_dl"] = len(terms)
+        doc_freq.update(event["_tf"].keys())
+    _trigram_index = trigram_index
+    n_docs = len(events)
+    _bm25_idf = {term: math.log((n_docs - df + 0.5) / (df + 0.5) + 1) for term, df in doc_freq.items()}
+    _bm25_avgdl = (sum(e["_dl"] for e in events) / n_docs) if n_docs else 0.0
+
+    dated = [e for e in events if e["_start_dt"] is not None and e["_end_dt"] is not None]
+    dated.sort(key=lambda e: e["_start_dt"])
+    _events_by_start = dated
+    _event_starts = [e["_start_dt"] for e in dated]
+    # Longest event bounds how far before a window an overlapping event can start
+    _max_event_span = max((e["_end_dt"] - e["_start_dt"] for e in dated), default=timedelta(0))
+    _tag_query_cache.clear()
+    _get_events_cache.clear()
+
+
+def _tokenize(text: str) -> list[str]:
+    return [t for t in _WORD_SPLIT_RE.split(text) if t]
+
+
+def event_keywords(event: dict) -> frozenset[str]:
+    """Interest-matching keywords: lowercased tags plus title/description words over 3 chars."""
+    return _event_keywords(tuple(event.get("tags", ())), event.get("title", ""), event.get("description", ""))
+
+
+@lru_cache(maxsize=1024)
+def _event_keywords(tags: tuple[str, ...], title: str, description: str) -> frozenset[str]:
+    # Keyed on content so seed projections and cached live results share entries
+    words = {tag.lower() for tag in tags}
+    words.update(w for w in f"{title} {description}".lower().split() if len(w) > 3)
+    return frozenset(words)
+
+
+def _bm25(event: dict, query_terms: list[str]) -> float:
+    tf = event["_tf"]
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * event["_dl"] / (_bm25_avgdl or 1.0))
+    score = 0.0
+    for term in query_terms:
+        freq = tf.get(term)
+        if freq:
+            score += _bm25_idf[term] * freq * (BM25_K1 + 1) / (freq + norm)
+    return score
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _seed_candidates(q: str, count: int):
+    """
+    Indices of seed events that may contain q as a substring.
+    Every trigram of q must appear in a matching haystack, so intersecting
+    posting lists gives a superset that the caller still verifies with `in`.
+    """
+    if len(q) < 3:
+        return range(count)
+    postings = []
+    for gram in _trigrams(q):
+        posting = _trigram_index.get(gram)
+        if not posting:
+            return ()
+        postings.append(posting)
+    postings.sort(key=len)
+    return sorted(postings[0].intersection(*postings[1:]))
+
+
+def _try_fromisoformat(raw) -> datetime | None:
+    try:
+        return datetime.fromisoformat(raw)
+    except (ValueError, TypeError):
+        return None
+
+
+def _get_http() -> httpx.AsyncClient:
+    """Shared client for live event providers; keeps connections alive across searches."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            http2=True,
+            timeout=6.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http
+
+
+async def close_http() -> None:
+    """Close the shared events client. Call at shutdown."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
 def reload_events() -> None:
     """Force reload events from disk (useful after data changes)."""
     global _events_cache
@@ -53,90 +254,180 @@ def reload_events() -> None:
     _load_events()
 
 
-def _parse_time_range(time_range: str) -> tuple[datetime, datetime]:
+def _tonight(now: datetime) -> tuple[datetime, datetime]:
+    start = now.replace(hour=17, minute=0, second=0, microsecond=0)
+    end = now.replace(hour=23, minute=59, second=59, microsecond=0)
+    return start, end
+
+
+def _tomorrow(now: datetime) -> tuple[datetime, datetime]:
+    tomorrow = now + timedelta(days=1)
+    start = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = tomorrow.replace(hour=23, minute=59, second=59, microsecond=0)
+    return start, end
+
+
+def _weekend(now: datetime) -> tuple[datetime, datetime]:
+    # Find next Saturday
+    days_until_saturday = (5 - now.weekday()) % 7
+    if days_until_saturday == 0 and now.weekday() != 5:
+        days_until_saturday = 7
+    saturday = now + timedelta(days=days_until_saturday)
+    start = saturday.replace(hour=0, minute=0, second=0, microsecond=0)
+    sunday = saturday + timedelta(days=1)
+    end = sunday.replace(hour=23, minute=59, second=59, microsecond=0)
+    return start, end
+
+
+def _today(now: datetime) -> tuple[datetime, datetime]:
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = now.replace(hour=23, minute=59, second=59, microsecond=0)
+    return start, end
+
+
+_RANGE_HANDLERS: dict[str, Callable[[datetime], tuple[datetime, datetime]]] = {
+    "tonight": _tonight,
+    "this evening": _tonight,
+    "tomorrow": _tomorrow,
+    "this weekend": _weekend,
+    "weekend": _weekend,
+    "today": _today,
+}
+
+
+@lru_cache(maxsize=64)
+def _named_range(range_key: str, day: date) -> tuple[datetime, datetime]:
+    """Named ranges depend only on the calendar day, so each is computed once per day."""
+    return _RANGE_HANDLERS[range_key](datetime.combine(day, datetime.min.time()))
+
+
+def _parse_time_range(time_range: str, now: datetime | None = None) -> tuple[datetime, datetime]:
     """
     Parse natural-language time ranges into start/end datetimes.
     'tonight' = 5PM-midnight today
     'tomorrow' = next day 00:00-23:59
     'this weekend' = Saturday + Sunday
     """
-    now = datetime.now()
-    time_range_lower = time_range.lower().strip()
-
-    if time_range_lower in ("tonight", "this evening"):
-        start = now.replace(hour=17, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=0)
-        return start, end
-
-    if time_range_lower == "tomorrow":
-        tomorrow = now + timedelta(days=1)
-        start = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = tomorrow.replace(hour=23, minute=59, second=59, microsecond=0)
-        return start, end
-
-    if time_range_lower in ("this weekend", "weekend"):
-        # Find next Saturday
-        days_until_saturday = (5 - now.weekday()) % 7
-        if days_until_saturday == 0 and now.weekday() != 5:
-            days_until_saturday = 7
-        saturday = now + timedelta(days=days_until_saturday)
-        start = saturday.replace(hour=0, minute=0, second=0, microsecond=0)
-        sunday = saturday + timedelta(days=1)
-        end = sunday.replace(hour=23, minute=59, second=59, microsecond=0)
-        return start, end
-
-    if time_range_lower == "today":
-        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(hour=23, minute=59, second=59, microsecond=0)
-        return start, end
+    if now is None:
+        now = datetime.now()
+    range_key = time_range.lower().strip()
+    if range_key in _RANGE_HANDLERS:
+        return _named_range(range_key, now.date())
 
     # Default: next 24 hours
     return now, now + timedelta(hours=24)
 
 
+def _window_cache_expiry(now: datetime, *window_ends: datetime) -> float:
+    """
+    Expiry timestamp for cached named-range results: the earliest window end, capped
+    at the next local midnight, since "tomorrow"/"this weekend" shift with the day.
+    """
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return min(next_midnight, *window_ends).timestamp()
+
+
 def get_events(time_range: str = "today", tags: list[str] | None = None) -> dict:
     """
     Get campus events filtered by time range and optional tags.
     Returns: {ok: bool, events: [...]}
     """
     try:
-        events = _load_events()
-        start, end = _parse_time_range(time_range)
-
-        filtered = []
-        for event in events:
-            try:
-                event_start = datetime.fromisoformat(event["start"])
-                event_end = datetime.fromisoformat(event["end"])
-            except (ValueError, KeyError):
-                continue
-
-            # Check time overlap
-            if event_end < start or event_start > end:
-                continue
-
-            # Check tag filter
-            if tags:
-                event_tags = set(event.get("tags", []))
-                if not event_tags.intersection(set(tags)):
-                    continue
+        _load_events()
+        range_key = time_range.lower().strip()
+        tags_set = frozenset(tags) if tags else None
+        now = datetime.now()
+        # Only named ranges have fixed bounds; the rolling 24h default moves with the clock.
+        # Named ranges are derived from the current day, so the day is part of the key.
+        cache_key = (
+            (range_key, tuple(sorted(tags_set)) if tags_set else (), now.date())
+            if range_key in _RANGE_HANDLERS else None
+        )
+        if cache_key is not None:
+            entry = _get_events_cache.get(cache_key)
+            if entry and time.time() < entry[0]:
+                _get_events_cache.move_to_end(cache_key)
+                return entry[1]
+
+        start, end = _parse_time_range(time_range, now)
+
+        # Only events starting in [start - longest span, end] can overlap the window
+        lo = bisect.bisect_left(_event_starts, start - _max_event_span)
+        hi = bisect.bisect_right(_event_starts, end, lo=lo)
+
+        # Tag filter first (cached index lookup), then the one time check bisect can't cover
+        if tags_set is not None:
+            # Tag matches are start-ordered indices, so the same window bisects into them
+            hits = _tag_query_hits(tags_set)
+            window = hits[bisect.bisect_left(hits, lo):bisect.bisect_left(hits, hi)]
+            candidates = map(_events_by_start.__getitem__, window)
+        else:
+            candidates = _events_by_start[lo:hi]
 
-            filtered.append({
-                "title": event.get("title", ""),
-                "start": event.get("start", ""),
-                "end": event.get("end", ""),
-                "location": event.get("location", ""),
-                "tags": event.get("tags", []),
-                "description": event.get("description", ""),
-            })
+        filtered = [event["_public"] for event in candidates if event["_end_dt"] >= start]
 
-        return {"ok": True, "events": filtered}
+        result = {"ok": True, "events": filtered}
+        if cache_key is not None:
+            _get_events_cache[cache_key] = (_window_cache_expiry(now, end), result)
+            _get_events_cache.move_to_end(cache_key)
+            if len(_get_events_cache) > _GET_EVENTS_CACHE_MAX:
+                _get_events_cache.popitem(last=False)
+        return result
 
     except Exception as e:
-        print(f"[EVENTS] Error: {e}")
+        log.warning("Error: %s", e)
         return {"ok": False, "events": [], "error": str(e)}
 
 
+def get_events_multi(time_ranges: list[str]) -> dict[str, list[dict]]:
+    """
+    Events for several time ranges from a single pass over the start index.
+    Returns {time_range: [...]} with the same projections get_events returns.
+    """
+    _load_events()
+    now = datetime.now()
+    # Keyed on the caller's strings, since the result dict is keyed by them too
+    cache_key = (
+        (tuple(time_ranges), None, now.date())
+        if all(r.lower().strip() in _RANGE_HANDLERS for r in time_ranges) else None
+    )
+    if cache_key is not None:
+        entry = _get_events_cache.get(cache_key)
+        if entry and time.time() < entry[0]:
+            _get_events_cache.move_to_end(cache_key)
+            return entry[1]
+
+    windows = [_parse_time_range(r, now) for r in time_ranges]
+    buckets: list[list[dict]] = [[] for _ in windows]
+    if windows:
+        lo = bisect.bisect_left(_event_starts, min(s for s, _ in windows) - _max_event_span)
+        hi = bisect.bisect_right(_event_starts, max(e for _, e in windows), lo=lo)
+        for event in _events_by_start[lo:hi]:
+            event_start, event_end = event["_start_dt"], event["_end_dt"]
+            for (start, end), bucket in zip(windows, buckets):
+                if event_start <= end and event_end >= start:
+                    bucket.append(event["_public"])
+
+    result = dict(zip(time_ranges, buckets))
+    if cache_key is not None:
+        _get_events_cache[cache_key] = (_window_cache_expiry(now, *(e for _, e in windows)), result)
+        _get_events_cache.move_to_end(cache_key)
+        if len(_get_events_cache) > _GET_EVENTS_CACHE_MAX:
+            _get_events_cache.popitem(last=False)
+    return result
+
+
+def _tag_query_hits(tags_set: frozenset) -> list[int]:
+    """Indices of dated events matching any of tags_set, cached per tag combination."""
+    hits = _tag_query_cache.get(tags_set)
+    if hits is None:
+        hits = [i for i, event in enumerate(_events_by_start) if not event["_tag_set"].isdisjoint(tags_set)]
+        if len(_tag_query_cache) >= _TAG_QUERY_CACHE_MAX:
+            _tag_query_cache.clear()
+        _tag_query_cache[tags_set] = hits
+    return hits
+
+
 async def search_realtime_events(query: str, city: str = "", size: int = 10, days_ahead: int = 28) -> dict:
     """
     Search real-time events from Ticketmaster Discovery API.
@@ -148,66 +439,104 @@ async def search_realtime_events(query: str, city: str = "", size: int = 10, day
 
     size = max(1, min(size, 200))
     days_ahead = max(7, min(days_ahead, 90))
-    cache_key = f"q={query.lower()}|city={city.lower().strip()}|size={size}|days={days_ahead}"
-    cached = _get_realtime_cache(cache_key)
+    cache_key = _realtime_search_key(query, city, size, days_ahead)
+    cached = _get_realtime_cache(
+        cache_key,
+        refresh=lambda: _search_realtime_uncached(query, city, size, days_ahead, cache_key),
+    )
     if cached:
         return cached
+    return await _search_realtime_uncached(query, city, size, days_ahead, cache_key)
 
-    # Prefer official school feed when available.
-    school_feed = _search_school_ics_events(query=query, city=city, size=size, days_ahead=days_ahead)
-    if school_feed.get("ok") and school_feed.get("events"):
-        school_feed["events"] = _filter_events_window(school_feed.get("events", []), days_ahead=days_ahead)[:size]
-        _set_realtime_cache(cache_key, school_feed)
-        return school_feed
-
-    if TICKETMASTER_API_KEY:
-        now_utc = datetime.utcnow()
-        end_utc = now_utc + timedelta(days=days_ahead)
-        params = {
-            "apikey": TICKETMASTER_API_KEY,
-            "keyword": query,
-            "size": size,
-            "sort": "date,asc",
-            "startDateTime": now_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "endDateTime": end_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
-        if city.strip():
-            params["city"] = city.strip()
 
-        try:
-            async with httpx.AsyncClient(timeout=6.0) as client:
-                response = await client.get(TICKETMASTER_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-            embedded = data.get("_embedded", {})
-            items = embedded.get("events", [])
-            events = [_normalize_ticketmaster_event(item) for item in items]
-            events = _filter_events_window(events, days_ahead=days_ahead)[:size]
-            result = {
-                "ok": True,
-                "events": events,
-                "source": "ticketmaster",
-                "live": True,
-            }
-            _set_realtime_cache(cache_key, result)
-            return result
-        except Exception as e:
-            print(f"[EVENTS] Real-time search failed, using fallback: {e}")
-
-    web_result = _search_web_events(query=query, city=city, size=size)
-    if web_result.get("ok") and web_result.get("events"):
-        # Web results are generally undated; keep as-is and cap to requested size.
-        web_result["events"] = web_result.get("events", [])[:size]
-        _set_realtime_cache(cache_key, web_result)
-        return web_result
-
-    fallback = _search_seed_events(query=query, city=city, size=size, days_ahead=days_ahead)
+def _realtime_search_key(query: str, city: str, size: int, days_ahead: int) -> str:
+    return f"q={query.lower()}|city={city.lower().strip()}|size={size}|days={days_ahead}"
+
+
+async def _search_realtime_uncached(query: str, city: str, size: int, days_ahead: int, cache_key: str) -> dict:
+    """Run the live source chain and store the winner under cache_key."""
+    # One clock read per search; every window filter below shares it
+    now = datetime.now()
+    now_et = now.astimezone(US_EASTERN)
+
+    # Fire every live source at once, then take results in priority order
+    # (school feed > Ticketmaster > web search); losers are cancelled.
+    school_task = asyncio.create_task(
+        _search_school_ics_events(query=query, city=city, size=size, days_ahead=days_ahead, now=now_et)
+    )
+    ticketmaster_task = (
+        asyncio.create_task(_search_ticketmaster_events(query=query, city=city, size=size, days_ahead=days_ahead, now=now_et))
+        if TICKETMASTER_API_KEY
+        else None
+    )
+    web_task = asyncio.create_task(_search_web_events(query=query, city=city, size=size))
+    pending = [task for task in (school_task, ticketmaster_task, web_task) if task is not None]
+
+    try:
+        # Prefer official school feed when available.
+        school_feed = await school_task
+        if school_feed.get("ok") and school_feed.get("events"):
+            school_feed["events"] = _filter_events_window(school_feed.get("events", []), days_ahead=days_ahead, now=now_et)[:size]
+            _set_realtime_cache(cache_key, school_feed)
+            return school_feed
+
+        if ticketmaster_task is not None:
+            result = await ticketmaster_task
+            if result is not None:
+                _set_realtime_cache(cache_key, result)
+                return result
+
+        web_result = await web_task
+        if web_result.get("ok") and web_result.get("events"):
+            # Web results are generally undated; keep as-is and cap to requested size.
+            web_result["events"] = web_result.get("events", [])[:size]
+            _set_realtime_cache(cache_key, web_result)
+            return web_result
+    finally:
+        for task in pending:
+            task.cancel()
+
+    fallback = _search_seed_events(query=query, city=city, size=size, days_ahead=days_ahead, now=now)
     fallback["live"] = False
-    fallback["events"] = _filter_events_window(fallback.get("events", []), days_ahead=days_ahead)[:size]
+    fallback["events"] = _filter_events_window(fallback.get("events", []), days_ahead=days_ahead, now=now_et)[:size]
     _set_realtime_cache(cache_key, fallback)
     return fallback
 
 
+async def _search_ticketmaster_events(
+    query: str, city: str, size: int, days_ahead: int, now: datetime
+) -> dict | None:
+    """Query the Ticketmaster Discovery API. Returns None on failure so callers fall back."""
+    now_utc = now.astimezone(timezone.utc)
+    end_utc = now_utc + timedelta(days=days_ahead)
+    params = {
+        "apikey": TICKETMASTER_API_KEY,
+        "keyword": query,
+        "size": size,
+        "sort": "date,asc",
+        "startDateTime": now_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "endDateTime": end_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+    if city.strip():
+        params["city"] = city.strip()
+
+    try:
+        response = await _get_http().get(TICKETMASTER_URL, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        items = (data.get("_embedded") or _EMPTY).get("events") or ()
+        events = [_normalize_ticketmaster_event(item) for item in items]
+        return {
+            "ok": True,
+            "events": _filter_events_window(events, days_ahead=days_ahead, now=now)[:size],
+            "source": "ticketmaster",
+            "live": True,
+        }
+    except Exception as e:
+        log.warning("Real-time search failed, using fallback: %s", e)
+        return None
+
+
 async def discover_events(city: str = "", size: int = 12, days_ahead: int = 28) -> dict:
     """
     Curated discovery feed for campus life.
@@ -219,84 +548,99 @@ async def discover_events(city: str = "", size: int = 12, days_ahead: int = 28)
     now = datetime.now()
     # Time-anchored query keeps results from getting stale.
     query = f"campus student university events {now.strftime('%B %Y')}"
-    result = await search_realtime_events(query=query, city=city, size=size, days_ahead=days_ahead)
+    cache_key = f"discover|q={query.lower()}|city={city.lower()}|size={size}|days={days_ahead}"
+    # Stale-while-revalidate like search_realtime_events; the refresh rebuilds the feed itself
+    cached = _get_realtime_cache(
+        cache_key,
+        refresh=lambda: _discover_uncached(query, city, size, days_ahead, cache_key),
+    )
+    if cached:
+        return cached
+    return await _discover_uncached(query, city, size, days_ahead, cache_key)
+
+
+async def _discover_uncached(query: str, city: str, size: int, days_ahead: int, cache_key: str) -> dict:
+    """Build the discover feed from a live search and store it under cache_key."""
+    now = datetime.now()
+    # Straight to the live source chain: going through search_realtime_events could hand back
+    # a stale search entry, which would then be stored here with a fresh TTL.
+    result = await _search_realtime_uncached(
+        query, city, size, days_ahead, _realtime_search_key(query, city, size, days_ahead)
+    )
     if not result.get("ok"):
         return result
-    return {
+
+    events = result.get("events", [])
+    source = result.get("source", "unknown")
+    live = bool(result.get("live"))
+    if not events:
+        # Live provider answered with nothing; local seed events keep the feed populated.
+        fallback = _search_seed_events(query=query, city=city, size=size, days_ahead=days_ahead, now=now)
+        events = _filter_events_window(fallback.get("events", []), days_ahead=days_ahead)[:size]
+        source = fallback.get("source", source)
+        live = False
+
+    feed = {
         "ok": True,
-        "events": result.get("events", []),
-        "source": result.get("source", "unknown"),
-        "live": bool(result.get("live")),
+        "events": events,
+        "source": source,
+        "live": live,
         "city": city,
         "cached": True,
         "cache_ttl_sec": EVENTS_CACHE_TTL_SEC,
         "days_ahead": days_ahead,
     }
+    _set_realtime_cache(cache_key, feed)
+    return feed
 
 
-def _search_seed_events(query: str, city: str = "", size: int = 10, days_ahead: int = 28) -> dict:
+def _search_seed_events(
+    query: str, city: str = "", size: int = 10, days_ahead: int = 28, now: datetime | None = None
+) -> dict:
     events = _load_events()
     q = query.lower().strip()
     city_q = city.lower().strip()
 
+    query_terms = _tokenize(q)
     scored = []
-    for event in events:
-        title = event.get("title", "")
-        desc = event.get("description", "")
-        location = event.get("location", "")
-        tags = " ".join(event.get("tags", []))
-        haystack = f"{title} {desc} {location} {tags}".lower()
-
-        if q not in haystack:
+    for i in _seed_candidates(q, len(events)):
+        event = events[i]
+        if q not in event["_haystack_lc"]:
             continue
-        if city_q and city_q not in location.lower():
+        if city_q and city_q not in event["_location_lc"]:
             continue
 
-        score = 0
-        if q in title.lower():
-            score += 3
-        if q in tags.lower():
-            score += 2
-        if q in desc.lower():
-            score += 1
-        scored.append((score, event))
+        # BM25 ranks; the old title/tags/description tiers break ties (e.g. substring-only hits)
+        tier = 0
+        if q in event["_title_lc"]:
+            tier += 3
+        if q in event["_tags_lc"]:
+            tier += 2
+        if q in event["_desc_lc"]:
+            tier += 1
+        scored.append((_bm25(event, query_terms), tier, event))
 
     days_ahead = max(7, min(days_ahead, 90))
-    scored.sort(key=lambda item: (item[0], item[1].get("start", "")), reverse=True)
-    top = [item[1] for item in scored[:size]]
+    best = heapq.nlargest(size, scored, key=lambda item: (item[0], item[1], item[2].get("start", "")))
+    top = [item[2] for item in best]
     source = "seed_fallback"
 
     # If query match is empty, return upcoming items so UI is never blank.
     if not top:
         source = "seed_fallback_default"
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         cutoff = now + timedelta(days=days_ahead)
-        upcoming = []
-        for event in events:
-            location = event.get("location", "")
-            start_raw = event.get("start", "")
-            try:
-                start_dt = datetime.fromisoformat(start_raw)
-            except Exception:
-                continue
-            if start_dt < now:
-                continue
-            if start_dt > cutoff:
-                continue
-            if city_q and city_q not in location.lower():
-                continue
-            upcoming.append(event)
+        # Start times were parsed once at load; no per-request fromisoformat
+        in_window = [
+            event for event in events
+            if event["_start_dt"] is not None and now <= event["_start_dt"] <= cutoff
+        ]
+        upcoming = [event for event in in_window if city_q in event["_location_lc"]] if city_q else in_window
 
         # If strict city matching produces no results, relax it.
         if not upcoming:
-            for event in events:
-                start_raw = event.get("start", "")
-                try:
-                    start_dt = datetime.fromisoformat(start_raw)
-                except Exception:
-                    continue
-                if now <= start_dt <= cutoff:
-                    upcoming.append(event)
+            upcoming = in_window
         upcoming.sort(key=lambda evt: evt.get("start", ""))
         top = upcoming[:size]
     normalized = [
@@ -315,7 +659,9 @@ def _search_seed_events(query: str, city: str = "", size: int = 10, days_ahead:
     return {"ok": True, "events": normalized, "source": source}
 
 
-def _search_school_ics_events(query: str, city: str = "", size: int = 10, days_ahead: int = 28) -> dict:
+async def _search_school_ics_events(
+    query: str, city: str = "", size: int = 10, days_ahead: int = 28, now: datetime | None = None
+) -> dict:
     """
     Pull events from school ICS feed (GMU Mason360) when location/context matches.
     """
@@ -326,18 +672,21 @@ def _search_school_ics_events(query: str, city: str = "", size: int = 10, days_a
         return {"ok": True, "events": [], "source": "school_ics", "live": False}
 
     try:
-        ics_text = _fetch_text_url(
+        ics_bytes = await _fetch_bytes_url(
             GMU_ICS_URL,
             {"User-Agent": "Vuddy/1.0"},
             None,
             6.0,
         )
-        events = _parse_school_ics(
-            ics_text=ics_text,
+        # Large feeds are pure string crunching; keep it off the event loop
+        events = await asyncio.to_thread(
+            _parse_school_ics,
+            ics_bytes=ics_bytes,
             query=query,
             city=city,
             size=size,
             days_ahead=days_ahead,
+            now=now,
         )
         return {
             "ok": True,
@@ -346,11 +695,11 @@ def _search_school_ics_events(query: str, city: str = "", size: int = 10, days_a
             "live": True,
         }
     except Exception as e:
-        print(f"[EVENTS] School ICS fetch failed: {e}")
+        log.warning("School ICS fetch failed: %s", e)
         return {"ok": False, "events": [], "source": "school_ics", "live": False, "error": str(e)}
 
 
-def _search_web_events(query: str, city: str = "", size: int = 10) -> dict:
+async def _search_web_events(query: str, city: str = "", size: int = 10) -> dict:
     """
     Live web search fallback using DuckDuckGo HTML results.
     No API key required; returns source links users can click through.
@@ -360,7 +709,7 @@ def _search_web_events(query: str, city: str = "", size: int = 10) -> dict:
         return {"ok": False, "events": [], "source": "web_search", "live": False}
 
     try:
-        html = _fetch_text_url(
+        html = await _fetch_text_url(
             DUCKDUCKGO_HTML_URL,
             {"User-Agent": "Vuddy/1.0"},
             {"q": search_terms},
@@ -374,26 +723,35 @@ def _search_web_events(query: str, city: str = "", size: int = 10) -> dict:
             "live": True,
         }
     except Exception as e:
-        print(f"[EVENTS] Web search fallback failed: {e}")
+        log.warning("Web search fallback failed: %s", e)
         return {"ok": False, "events": [], "source": "web_search", "live": False, "error": str(e)}
 
 
-def _parse_duckduckgo_events(html: str, city: str = "", size: int = 10) -> list[dict]:
-    anchor_pattern = re.compile(
-        r'<a[^>]*class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>',
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    snippet_pattern = re.compile(
-        r'<a[^>]*class="result__snippet"[^>]*>(.*?)</a>',
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+def _extract_ddg_results(html: str) -> tuple[list[tuple[str, str]], list[str]]:
+    """
+    Pull (href, title) anchors and snippet texts from a DuckDuckGo HTML page.
+    Uses selectolax's single-pass parser when installed, else the regex patterns.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        anchors = [
+            (node.attributes.get("href") or "", node.text().strip())
+            for node in tree.css("a.result__a")
+        ]
+        snippets = [node.text().strip() for node in tree.css("a.result__snippet")]
+        return anchors, snippets
+
+    anchors = [(href, _strip_html(title)) for href, title in _DDG_ANCHOR_RE.findall(html)]
+    snippets = [_strip_html(snippet) for snippet in _DDG_SNIPPET_RE.findall(html)]
+    return anchors, snippets
+
 
-    anchors = anchor_pattern.findall(html)
-    snippets = snippet_pattern.findall(html)
+def _parse_duckduckgo_events(html: str, city: str = "", size: int = 10) -> list[dict]:
+    anchors, snippets = _extract_ddg_results(html)
     events: list[dict] = []
     seen_urls: set[str] = set()
 
-    for idx, (raw_href, raw_title) in enumerate(anchors):
+    for idx, (raw_href, title) in enumerate(anchors):
         if len(events) >= size:
             break
         url = _clean_ddg_link(raw_href)
@@ -401,8 +759,7 @@ def _parse_duckduckgo_events(html: str, city: str = "", size: int = 10) -> list[
             continue
         seen_urls.add(url)
 
-        title = _strip_html(raw_title)
-        snippet = _strip_html(snippets[idx]) if idx < len(snippets) else ""
+        snippet = snippets[idx] if idx < len(snippets) else ""
         if not title:
             continue
 
@@ -425,51 +782,53 @@ def _parse_duckduckgo_events(html: str, city: str = "", size: int = 10) -> list[
     return events
 
 
-def _fetch_text_url(url: str, headers: dict[str, str] | None, params: dict[str, str] | None, timeout_sec: float) -> str:
-    query = urlencode(params or {})
-    final_url = f"{url}?{query}" if query else url
-    cmd = [
-        "curl",
-        "-fsSL",
-        "--max-time",
-        str(int(timeout_sec)),
-        "--connect-timeout",
-        "3",
-    ]
-    for key, value in (headers or {}).items():
-        cmd.extend(["-H", f"{key}: {value}"])
-    cmd.append(final_url)
-    completed = subprocess.run(
-        cmd,
-        check=True,
-        capture_output=True,
-        text=True,
-        timeout=max(2, int(timeout_sec) + 1),
+async def _fetch_url(url: str, headers: dict[str, str] | None, params: dict[str, str] | None, timeout_sec: float) -> httpx.Response:
+    # follow_redirects matches the old `curl -L` behaviour
+    response = await _get_http().get(
+        url, params=params, headers=headers, timeout=timeout_sec, follow_redirects=True
     )
-    return completed.stdout
+    response.raise_for_status()
+    return response
+
+
+async def _fetch_text_url(url: str, headers: dict[str, str] | None, params: dict[str, str] | None, timeout_sec: float) -> str:
+    return (await _fetch_url(url, headers, params, timeout_sec)).text
 
 
-def _parse_school_ics(ics_text: str, query: str, city: str = "", size: int = 10, days_ahead: int = 28) -> list[dict]:
-    lines = _unfold_ics_lines(ics_text)
+async def _fetch_bytes_url(url: str, headers: dict[str, str] | None, params: dict[str, str] | None, timeout_sec: float) -> bytes:
+    """Raw body, for large feeds that are decoded piecemeal rather than as one str."""
+    return (await _fetch_url(url, headers, params, timeout_sec)).content
+
+
+def _parse_school_ics(
+    ics_bytes: bytes, query: str, city: str = "", size: int = 10, days_ahead: int = 28, now: datetime | None = None
+) -> list[dict]:
     events: list[dict] = []
     block: dict[str, str] = {}
     in_event = False
-    now_et = datetime.now(US_EASTERN)
+    now_et = now or datetime.now(US_EASTERN)
     days_ahead = max(7, min(days_ahead, 90))
     cutoff = now_et + timedelta(days=days_ahead)
-    query_tokens = [t for t in re.split(r"[\W_]+", (query or "").lower()) if len(t) > 2]
-
-    for line in lines:
+    # DTSTART values start with YYYYMMDD, so a string compare on that prefix rejects
+    # out-of-window events before any datetime is built (one day of slack covers UTC offsets)
+    min_day = (now_et - timedelta(days=1)).strftime("%Y%m%d")
+    max_day = (cutoff + timedelta(days=1)).strftime("%Y%m%d")
+    query_tokens = [t for t in _ICS_TOKEN_RE.split((query or "").lower()) if len(t) > 2]
+    # One alternation scans each haystack once instead of once per token
+    query_re = re.compile("|".join(map(re.escape, query_tokens))) if query_tokens else None
+
+    for line in _iter_unfolded_ics_lines(ics_bytes):
         if line == "BEGIN:VEVENT":
             in_event = True
             block = {}
             continue
         if line == "END:VEVENT":
-            if block:
+            day = block.get("DTSTART", "")[:8]
+            if block and min_day <= day <= max_day:
                 parsed = _normalize_ics_event(block, city=city)
                 if parsed and now_et <= parsed["_start_dt"] <= cutoff:
                     haystack = f"{parsed['title']} {parsed['description']} {parsed['location']}".lower()
-                    if not query_tokens or any(token in haystack for token in query_tokens):
+                    if query_re is None or query_re.search(haystack):
                         parsed.pop("_start_dt", None)
                         events.append(parsed)
             in_event = False
@@ -481,20 +840,21 @@ def _parse_school_ics(ics_text: str, query: str, city: str = "", size: int = 10,
         key, sep, value = line.partition(":")
         if not sep:
             continue
-        field = key.split(";", 1)[0].upper()
-        if field in {"SUMMARY", "DTSTART", "DTEND", "LOCATION", "DESCRIPTION", "URL"}:
+        field = key.partition(";")[0].upper()
+        if field in _ICS_FIELDS:
             block[field] = value.strip()
 
     events.sort(key=lambda evt: evt.get("start", ""))
     return events[:size]
 
 
-def _filter_events_window(events: list[dict], days_ahead: int = 28) -> list[dict]:
+def _filter_events_window(events: list[dict], days_ahead: int = 28, now: datetime | None = None) -> list[dict]:
     """
     Keep events from now to N days ahead. Events without parseable dates are kept.
     """
     days_ahead = max(7, min(days_ahead, 90))
-    now = datetime.now(US_EASTERN)
+    if now is None:
+        now = datetime.now(US_EASTERN)
     cutoff = now + timedelta(days=days_ahead)
     filtered: list[dict] = []
     undated: list[dict] = []
@@ -526,18 +886,25 @@ def _filter_events_window(events: list[dict], days_ahead: int = 28) -> list[dict
     return filtered + undated
 
 
-def _unfold_ics_lines(ics_text: str) -> list[str]:
-    raw_lines = (ics_text or "").replace("\r\n", "\n").split("\n")
-    lines: list[str] = []
-    for raw in raw_lines:
-        if not lines:
-            lines.append(raw)
+def _iter_unfolded_ics_lines(ics_bytes: bytes) -> Iterator[str]:
+    """
+    Yield logical ICS lines, joining folded continuations, without building a line list.
+    Works on the raw bytes and decodes each logical line once, so folds that split a
+    multi-byte character (RFC 5545 folds by octet) still decode cleanly.
+    """
+    buffer: bytes | None = None
+    for raw in io.BytesIO(ics_bytes or b""):
+        raw = raw.rstrip(b"\n")
+        if raw.endswith(b"\r"):
+            raw = raw[:-1]
+        if buffer is not None and raw[:1] in (b" ", b"\t"):
+            buffer += raw[1:]
             continue
-        if raw.startswith(" ") or raw.startswith("\t"):
-            lines[-1] += raw[1:]
-        else:
-            lines.append(raw)
-    return lines
+        if buffer is not None:
+            yield buffer.decode("utf-8", "replace")
+        buffer = raw
+    if buffer is not None:
+        yield buffer.decode("utf-8", "replace")
 
 
 def _normalize_ics_event(block: dict[str, str], city: str = "") -> dict | None:
@@ -556,7 +923,8 @@ def _normalize_ics_event(block: dict[str, str], city: str = "") -> dict | None:
     url = block.get("URL", "").strip()
 
     return {
-        "id": f"ics_{hashlib.sha1(f'{title}|{start_dt.isoformat()}|{location}'.encode()).hexdigest()[:10]}",
+        # 40-bit BLAKE2b digest sized to the 10-hex ID directly instead of truncating SHA-1
+        "id": f"ics_{hashlib.blake2b(f'{title}|{start_dt.isoformat()}|{location}'.encode(), digest_size=5).hexdigest()}",
         "title": title,
         "start": start_dt.isoformat(),
         "end": end_dt.isoformat(),
@@ -574,29 +942,23 @@ def _parse_ics_datetime(value: str) -> datetime | None:
         return None
 
     # Date-only format: YYYYMMDD
-    if re.fullmatch(r"\d{8}", raw):
+    if _ICS_DATE_RE.fullmatch(raw):
         dt = datetime.strptime(raw, "%Y%m%d")
         return dt.replace(tzinfo=US_EASTERN)
 
     # UTC datetime format: YYYYMMDDTHHMMSSZ
-    if re.fullmatch(r"\d{8}T\d{6}Z", raw):
+    if _ICS_UTC_RE.fullmatch(raw):
         return datetime.strptime(raw, "%Y%m%dT%H%M%SZ").replace(tzinfo=ZoneInfo("UTC")).astimezone(US_EASTERN)
 
     # Local datetime format: YYYYMMDDTHHMMSS
-    if re.fullmatch(r"\d{8}T\d{6}", raw):
+    if _ICS_LOCAL_RE.fullmatch(raw):
         return datetime.strptime(raw, "%Y%m%dT%H%M%S").replace(tzinfo=US_EASTERN)
 
     return None
 
 
 def _decode_ics_text(text: str) -> str:
-    return (
-        text.replace("\\n", "\n")
-        .replace("\\,", ",")
-        .replace("\\;", ";")
-        .replace("\\\\", "\\")
-        .strip()
-    )
+    return _ICS_ESCAPE_RE.sub(lambda m: _ICS_ESCAPES[m.group(0)], text).strip()
 
 
 def _clean_ddg_link(url: str) -> str:
@@ -615,54 +977,104 @@ def _clean_ddg_link(url: str) -> str:
 
 
 def _strip_html(raw: str) -> str:
-    text = re.sub(r"<[^>]+>", "", raw or "")
+    text = _STRIP_TAGS_RE.sub("", raw or "")
     return unescape(text).strip()
 
 
 def _normalize_ticketmaster_event(item: dict) -> dict:
-    dates = item.get("dates", {}).get("start", {})
-    start = dates.get("dateTime") or dates.get("localDate", "")
-    end = item.get("dates", {}).get("end", {}).get("dateTime", "")
-
-    venues = item.get("_embedded", {}).get("venues", [])
-    venue_name = venues[0].get("name", "") if venues else ""
-    city = venues[0].get("city", {}).get("name", "") if venues else ""
-    state = venues[0].get("state", {}).get("stateCode", "") if venues else ""
-    location_parts = [part for part in [venue_name, city, state] if part]
-
-    classifications = item.get("classifications", [])
-    tags: list[str] = []
-    if classifications:
-        segment = classifications[0].get("segment", {})
-        genre = classifications[0].get("genre", {})
-        sub_genre = classifications[0].get("subGenre", {})
-        for candidate in (segment.get("name"), genre.get("name"), sub_genre.get("name")):
-            if candidate:
-                tags.append(candidate)
+    dates = item.get("dates") or _EMPTY
+    start_info = dates.get("start") or _EMPTY
+    start = start_info.get("dateTime") or start_info.get("localDate", "")
+    end = (dates.get("end") or _EMPTY).get("dateTime", "")
+
+    venues = (item.get("_embedded") or _EMPTY).get("venues")
+    venue = venues[0] if venues else _EMPTY
+    location = ", ".join(
+        part
+        for part in (
+            venue.get("name", ""),
+            (venue.get("city") or _EMPTY).get("name", ""),
+            (venue.get("state") or _EMPTY).get("stateCode", ""),
+        )
+        if part
+    )
+
+    classifications = item.get("classifications")
+    primary = classifications[0] if classifications else _EMPTY
+    tags = [
+        name
+        for name in (
+            (primary.get("segment") or _EMPTY).get("name"),
+            (primary.get("genre") or _EMPTY).get("name"),
+            (primary.get("subGenre") or _EMPTY).get("name"),
+        )
+        if name
+    ]
 
     return {
         "id": item.get("id", ""),
         "title": item.get("name", ""),
         "start": start,
         "end": end,
-        "location": ", ".join(location_parts),
+        "location": location,
         "description": item.get("info") or item.get("pleaseNote", ""),
         "tags": tags,
         "url": item.get("url", ""),
     }
 
 
-def _get_realtime_cache(cache_key: str) -> dict | None:
-    now = datetime.utcnow().timestamp()
+def _purge_expired_realtime(now: float) -> None:
+    while _realtime_expiry_heap and _realtime_expiry_heap[0][0] <= now:
+        expires_at, cache_key = heapq.heappop(_realtime_expiry_heap)
+        entry = _realtime_cache.get(cache_key)
+        # Skip heap entries superseded by a later set of the same key
+        if entry and entry[0] == expires_at:
+            del _realtime_cache[cache_key]
+
+
+def _get_realtime_cache(cache_key: str, refresh: Callable[[], Awaitable[dict]] | None = None) -> dict | None:
+    """
+    Return a cached value. Past its TTL, an entry is still returned (stale-while-revalidate)
+    when `refresh` is given, and a single background refresh is scheduled; otherwise it misses.
+    """
+    now = time.monotonic()
+    _purge_expired_realtime(now)
     entry = _realtime_cache.get(cache_key)
     if not entry:
         return None
-    if entry.get("expires_at", 0) <= now:
-        _realtime_cache.pop(cache_key, None)
-        return None
-    return entry.get("value")
+    _, stale_at, value = entry
+    if now >= stale_at:
+        if refresh is None:
+            return None
+        if cache_key not in _realtime_refreshing:
+            _realtime_refreshing.add(cache_key)
+            task = asyncio.create_task(_run_refresh(cache_key, refresh))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+    _realtime_cache.move_to_end(cache_key)
+    return value
+
+
+async def _run_refresh(cache_key: str, refresh: Callable[[], Awaitable[dict]]) -> None:
+    try:
+        await refresh()
+    except Exception as e:
+        log.warning("Background refresh failed for %s: %s", cache_key, e)
+    finally:
+        _realtime_refreshing.discard(cache_key)
 
 
 def _set_realtime_cache(cache_key: str, value: dict) -> None:
-    expires_at = datetime.utcnow().timestamp() + EVENTS_CACHE_TTL_SEC
-    _realtime_cache[cache_key] = {"expires_at": expires_at, "value": value}
+    now = time.monotonic()
+    _purge_expired_realtime(now)
+    stale_at = now + EVENTS_CACHE_TTL_SEC
+    expires_at = stale_at + EVENTS_CACHE_STALE_SEC
+    _realtime_cache[cache_key] = (expires_at, stale_at, value)
+    _realtime_cache.move_to_end(cache_key)
+    heapq.heappush(_realtime_expiry_heap, (expires_at, cache_key))
+    while len(_realtime_cache) > _REALTIME_CACHE_MAX:
+        _realtime_cache.popitem(last=False)
+    if len(_realtime_expiry_heap) > 2 * _REALTIME_CACHE_MAX:
+        # LRU evictions leave orphaned heap entries; rebuild from live keys to stay bounded
+        _realtime_expiry_heap[:] = [(entry[0], key) for key, entry in _realtime_cache.items()]
+        heapq.heapify(_realtime_expiry_heap)
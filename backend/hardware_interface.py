@@ -4,8 +4,11 @@ Every hardware call goes through this module. SimHardware is the default.
 The backend can always run with no serial device connected.
 """
 
+import asyncio
 import os
 
+import orjson
+
 from backend.constants import ASSISTANT_STATES
 
 HARDWARE_MODE = os.getenv("HARDWARE_MODE", "sim")
@@ -41,35 +44,41 @@ class ArduinoHardware(HardwareInterface):
 
         port = os.getenv("SERIAL_PORT", "/dev/ttyUSB0")
         baud = int(os.getenv("SERIAL_BAUD", "115200"))
-        self.ser = serial.Serial(port, baud, timeout=1)
+        # 400ms read timeout bounds the ACK wait in set_led_state
+        self.ser = serial.Serial(port, baud, timeout=0.4)
         self._cmd_counter = 0
+        # Threads would otherwise interleave frames and ACKs from concurrent LED updates
+        self._io_lock = asyncio.Lock()
 
     async def set_led_state(self, state: str, color: str = None) -> None:
-        import json
-
         self._cmd_counter += 1
         cmd_id = f"c{self._cmd_counter:03d}"
         cmd = {"t": "cmd", "id": cmd_id, "action": "set_status", "state": state}
         if color:
             cmd["color"] = color
-        self.ser.write((json.dumps(cmd) + "\n").encode())
-        # Wait up to 400ms for ACK, retry once, then fail-open
-        self.ser.timeout = 0.4
-        response = self.ser.readline().decode().strip()
-        if not response:
-            # Retry once
-            self.ser.write((json.dumps(cmd) + "\n").encode())
-            response = self.ser.readline().decode().strip()
+        # orjson emits bytes, so the frame is built once and reused for the retry
+        frame = orjson.dumps(cmd) + b"\n"
+        # Blocking serial I/O runs in a worker thread so the ACK wait never stalls the event loop
+        async with self._io_lock:
+            response = await asyncio.to_thread(self._send_and_read, frame)
+            if not response:
+                # Retry once
+                response = await asyncio.to_thread(self._send_and_read, frame)
         if response:
             try:
-                ack = json.loads(response)
+                ack = orjson.loads(response)
                 if ack.get("t") == "ack" and ack.get("ok"):
                     return
-            except json.JSONDecodeError:
+            except (orjson.JSONDecodeError, AttributeError):
                 pass
         # Fail-open: log and continue
         print(f"[HW] Arduino ACK timeout for cmd {cmd_id}, continuing")
 
+    def _send_and_read(self, frame: bytes) -> bytes:
+        """Write one command frame and wait up to the read timeout (400ms) for an ACK line."""
+        self.ser.write(frame)
+        return self.ser.readline().strip()
+
     async def on_button_event(self, callback) -> None:
         # In a real implementation, this would start a background reader
         # For Phase 2 implementation
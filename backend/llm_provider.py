@@ -4,22 +4,155 @@ Every LLM call goes through this module. Never call Ollama or PatriotAI directly
 Active provider is selected by LLM_PROVIDER env var.
 """
 
+import asyncio
+import hashlib
 import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 
 import httpx
+import orjson
 
 from backend.constants import LLM_PROVIDERS
 
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "ollama")
 
+# Content-addressed reply cache: identical (provider, model, messages, tools) within the TTL
+# reuse the previous reply instead of running inference again
+RESPONSE_CACHE_MAX = 64
+RESPONSE_CACHE_TTL_SEC = 300
+
+# A successful health probe is trusted this long; while unhealthy, a background poller
+# re-probes on this backoff schedule instead of each caller paying the round trip
+HEALTH_TTL_SEC = 10
+HEALTH_BACKOFF_SEC = (2, 5, 30)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# The tool schema is the same list object every turn; keep its encoding alongside it
+_tools_encoded: tuple[list[dict], bytes] | None = None
+
+
+def _tools_json(tools: list[dict]) -> bytes:
+    global _tools_encoded
+    if _tools_encoded is None or _tools_encoded[0] is not tools:
+        _tools_encoded = (tools, orjson.dumps(tools))
+    return _tools_encoded[1]
+
+
+def _json_body(payload: dict, tools: list[dict] | None = None) -> bytes:
+    """Encode a request body with orjson, splicing in the cached tool schema."""
+    body = orjson.dumps(payload)
+    if not tools:
+        return body
+    return body[:-1] + b',"tools":' + _tools_json(tools) + b"}"
+
 
 class LLMProvider:
-    """Base class for LLM providers."""
+    """Base class for LLM providers. Subclasses implement _chat (and optionally _stream_chat)."""
+
+    model: str = ""
 
-    async def chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
+    def __init__(self):
+        self._response_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._last_ok_ts = float("-inf")
+        self._health_task: asyncio.Task | None = None
+
+    async def chat(self, messages: list[dict], tools: list[dict] | None = None, bypass_cache: bool = False) -> dict:
+        key = None if bypass_cache else self._cache_key(messages, tools)
+        if key:
+            hit = self._cache_get(key)
+            if hit is not None:
+                return hit
+        message = await self._chat(messages, tools=tools)
+        if key:
+            self._cache_put(key, message)
+        return message
+
+    async def stream_chat(
+        self, messages: list[dict], tools: list[dict] | None = None, bypass_cache: bool = False
+    ) -> AsyncIterator[dict]:
+        """
+        Yield message deltas ({content?, tool_calls?}) as the reply is generated.
+        A cached reply is replayed as one delta; a stream closed early is not cached.
+        """
+        key = None if bypass_cache else self._cache_key(messages, tools)
+        if key:
+            hit = self._cache_get(key)
+            if hit is not None:
+                yield hit
+                return
+
+        content: list[str] = []
+        tool_calls: list[dict] = []
+        async for delta in self._stream_chat(messages, tools=tools):
+            content.append(delta.get("content") or "")
+            tool_calls.extend(delta.get("tool_calls") or ())
+            yield delta
+
+        if key:
+            message = {"role": "assistant", "content": "".join(content)}
+            if tool_calls:
+                message["tool_calls"] = tool_calls
+            self._cache_put(key, message)
+
+    async def _chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
         raise NotImplementedError
 
+    async def _stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[dict]:
+        """Default: a single delta carrying the full _chat() reply."""
+        yield await self._chat(messages, tools=tools)
+
+    def _cache_key(self, messages: list[dict], tools: list[dict] | None) -> str | None:
+        try:
+            raw = orjson.dumps((self.name, self.model, messages), option=orjson.OPT_SORT_KEYS)
+            tools_raw = _tools_json(tools) if tools else b"null"
+        except TypeError:
+            return None  # unserializable payload; just don't cache
+        digest = hashlib.blake2b(raw, digest_size=16)
+        digest.update(tools_raw)
+        return digest.hexdigest()
+
+    def _cache_get(self, key: str) -> dict | None:
+        entry = self._response_cache.get(key)
+        if not entry:
+            return None
+        expires_at, message = entry
+        if expires_at <= time.monotonic():
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return dict(message)
+
+    def _cache_put(self, key: str, message: dict) -> None:
+        self._response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL_SEC, dict(message))
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_MAX:
+            self._response_cache.popitem(last=False)
+
     async def health_check(self) -> bool:
+        """Cached health: True within HEALTH_TTL_SEC of a good probe, else probe (or poller state)."""
+        if time.monotonic() - self._last_ok_ts < HEALTH_TTL_SEC:
+            return True
+        if self._health_task is not None and not self._health_task.done():
+            return False  # poller is already retrying on backoff
+        if await self._probe_health():
+            self._last_ok_ts = time.monotonic()
+            return True
+        self._health_task = asyncio.create_task(self._poll_health())
+        return False
+
+    async def _poll_health(self) -> None:
+        attempt = 0
+        while True:
+            await asyncio.sleep(HEALTH_BACKOFF_SEC[min(attempt, len(HEALTH_BACKOFF_SEC) - 1)])
+            if await self._probe_health():
+                self._last_ok_ts = time.monotonic()
+                return
+            attempt += 1
+
+    async def _probe_health(self) -> bool:
         raise NotImplementedError
 
     @property
@@ -31,6 +164,7 @@ class OllamaProvider(LLMProvider):
     """Ollama local LLM. Works out of the box with `ollama serve`."""
 
     def __init__(self):
+        super().__init__()
         self.base_url = os.getenv("OLLAMA_HOST", "http://localhost:11434")
         self.model = os.getenv("OLLAMA_MODEL", "qwen3:8b")
         self.client = httpx.AsyncClient(timeout=180.0)
@@ -39,22 +173,41 @@ class OllamaProvider(LLMProvider):
     def name(self) -> str:
         return "ollama"
 
-    async def chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
+    async def _chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
+        # Collect the stream so chat() shares the streaming request path
+        message: dict = {"role": "assistant", "content": ""}
+        content: list[str] = []
+        async for delta in self._stream_chat(messages, tools=tools):
+            content.append(delta.get("content") or "")
+            if delta.get("tool_calls"):
+                message.setdefault("tool_calls", []).extend(delta["tool_calls"])
+        message["content"] = "".join(content)
+        return message
+
+    async def _stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[dict]:
         payload = {
             "model": self.model,
             "messages": messages,
             "options": {"num_ctx": 4096},
             "keep_alive": -1,
-            "stream": False,
+            "stream": True,
         }
-        if tools:
-            payload["tools"] = tools
-        resp = await self.client.post(f"{self.base_url}/api/chat", json=payload)
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("message", {})
+        async with self.client.stream(
+            "POST", f"{self.base_url}/api/chat", content=_json_body(payload, tools), headers=JSON_HEADERS
+        ) as resp:
+            resp.raise_for_status()
+            # Ollama streams newline-delimited JSON chunks
+            async for line in resp.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = orjson.loads(line)
+                message = chunk.get("message")
+                if message:
+                    yield message
+                if chunk.get("done"):
+                    break
 
-    async def health_check(self) -> bool:
+    async def _probe_health(self) -> bool:
         try:
             resp = await self.client.get(f"{self.base_url}/api/tags")
             return resp.status_code == 200
@@ -66,6 +219,7 @@ class PatriotAIProvider(LLMProvider):
     """PatriotAI cloud LLM. Swap to this for judging."""
 
     def __init__(self):
+        super().__init__()
         self.base_url = os.getenv("PATRIOTAI_BASE_URL", "https://api.patriotai.com/v1")
         self.api_key = os.getenv("PATRIOTAI_API_KEY", "")
         self.model = os.getenv("PATRIOTAI_MODEL", "patriotai-default")
@@ -75,21 +229,46 @@ class PatriotAIProvider(LLMProvider):
     def name(self) -> str:
         return "patriotai"
 
-    async def chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+    async def _chat(self, messages: list[dict], tools: list[dict] | None = None) -> dict:
+        headers = {"Authorization": f"Bearer {self.api_key}", **JSON_HEADERS}
         payload = {"model": self.model, "messages": messages}
-        if tools:
-            payload["tools"] = tools
         resp = await self.client.post(
             f"{self.base_url}/chat/completions",
-            json=payload,
+            content=_json_body(payload, tools),
             headers=headers,
         )
         resp.raise_for_status()
         data = resp.json()
         return data["choices"][0]["message"]
 
-    async def health_check(self) -> bool:
+    async def _stream_chat(self, messages: list[dict], tools: list[dict] | None = None) -> AsyncIterator[dict]:
+        if tools:
+            # Tool-call arguments arrive fragmented across SSE deltas; use the single-shot reply
+            yield await self._chat(messages, tools=tools)
+            return
+
+        headers = {"Authorization": f"Bearer {self.api_key}", **JSON_HEADERS}
+        payload = {"model": self.model, "messages": messages, "stream": True}
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            content=_json_body(payload),
+            headers=headers,
+        ) as resp:
+            resp.raise_for_status()
+            # OpenAI-compatible server-sent events: "data: {...}" ... "data: [DONE]"
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = orjson.loads(data).get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield {"content": content}
+
+    async def _probe_health(self) -> bool:
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
             resp = await self.client.get(f"{self.base_url}/models", headers=headers)
@@ -5,22 +5,41 @@ Main entry point. Startup, health, REST routes, WebSocket, CORS, audio serving.
 
 import os
 import asyncio
+import contextlib
+import logging
+import queue
+from email.utils import formatdate
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+import aiofiles
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 # Load .env file
 ROOT_DIR = Path(__file__).resolve().parents[1]
 load_dotenv(ROOT_DIR / ".env")
 
+# TTS, events and tools log through "vuddy.*" loggers; set LOG_LEVEL=DEBUG for per-request detail.
+# Records go through a queue so the console write happens on a listener thread, not the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_console = logging.StreamHandler()
+_log_console.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_console)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[QueueHandler(_log_queue)])
+_log_listener.start()
+
 from backend import brain, events_service, calendar_service, profile_store, school_config, elevenlabs_tts
 from backend.constants import ASSISTANT_STATES, WS_TYPES_IN
 from backend.hardware_interface import create_hardware
 from backend.llm_provider import create_llm_provider
 
+# Byte-range reads for TTS audio; 64 KiB keeps syscalls per MP3 low
+TTS_STREAM_CHUNK = 64 * 1024
+
 # Create the FastAPI app
 app = FastAPI(title="Vuddy Backend", version="1.0.0")
 
@@ -50,7 +69,7 @@ async def startup():
     1. Create LLM provider
     2. Create hardware (defaults to SimHardware)
     3. Init profile_store
-    4. Load events data
+    4. Load events and calendar data
     5. Verify ElevenLabs API key
     """
     global llm_provider, hardware
@@ -67,9 +86,10 @@ async def startup():
     profile_store.load_profile()
     print("[STARTUP] Profile store initialized")
 
-    # Step 4: Load events
+    # Step 4: Load events and calendar (calendar routes then stay in memory)
     events_service._load_events()
-    print("[STARTUP] Events data loaded")
+    calendar_service._load_calendar()
+    print("[STARTUP] Events and calendar data loaded")
 
     # Step 5: ElevenLabs check
     elevenlabs_key = os.getenv("ELEVENLABS_API_KEY", "")
@@ -84,6 +104,18 @@ async def startup():
     print("[STARTUP] Vuddy backend ready!")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Flush pending writes and close shared HTTP clients before exit."""
+    await calendar_service.aflush_calendar()
+    await asyncio.gather(
+        calendar_service.close_http(),
+        events_service.close_http(),
+        elevenlabs_tts.close_http(),
+    )
+    _log_listener.stop()
+
+
 # ── Health Endpoint ──────────────────────────────────────────────────
 
 @app.get("/health")
@@ -203,14 +235,14 @@ async def api_calendar_google_exchange(body: dict):
 @app.get("/api/profile")
 async def api_profile_get():
     """Get user profile."""
-    profile = profile_store.load_profile()
+    profile = await asyncio.to_thread(profile_store.load_profile)
     return {"ok": True, **profile}
 
 
 @app.put("/api/profile")
 async def api_profile_update(body: dict):
     """Update user profile."""
-    profile_store.update_profile(body)
+    await asyncio.to_thread(profile_store.update_profile, body)
     return {"ok": True}
 
 
@@ -246,10 +278,23 @@ async def serve_tts_audio(filename: str, request: Request):
     iOS Safari frequently requires 206 partial content for media playback.
     """
     filepath = os.path.join("data", "audio", "tts", filename)
-    if not os.path.exists(filepath):
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
         return JSONResponse({"ok": False, "error": "File not found"}, status_code=404)
 
-    file_size = os.path.getsize(filepath)
+    file_size = stat.st_size
+    # TTS files are content-addressed and never rewritten, so replays can be cached for good
+    etag = f'"{file_size:x}-{stat.st_mtime_ns:x}"'
+    cache_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=304, headers=cache_headers)
+
     range_header = request.headers.get("range")
 
     if range_header:
@@ -264,12 +309,12 @@ async def serve_tts_audio(filename: str, request: Request):
             start, end = 0, file_size - 1
             length = file_size
 
-        def iter_chunk():
-            with open(filepath, "rb") as f:
-                f.seek(start)
+        async def iter_chunk():
+            async with aiofiles.open(filepath, "rb") as f:
+                await f.seek(start)
                 remaining = length
                 while remaining > 0:
-                    chunk = f.read(min(8192, remaining))
+                    chunk = await f.read(min(TTS_STREAM_CHUNK, remaining))
                     if not chunk:
                         break
                     remaining -= len(chunk)
@@ -280,14 +325,16 @@ async def serve_tts_audio(filename: str, request: Request):
             "Accept-Ranges": "bytes",
             "Content-Length": str(length),
             "Content-Type": "audio/mpeg",
+            **cache_headers,
         }
         return StreamingResponse(iter_chunk(), status_code=206, headers=headers, media_type="audio/mpeg")
 
     headers = {
         "Accept-Ranges": "bytes",
         "Content-Length": str(file_size),
+        **cache_headers,
     }
-    return FileResponse(filepath, media_type="audio/mpeg", headers=headers)
+    return FileResponse(filepath, media_type="audio/mpeg", headers=headers, stat_result=stat)
 
 
 @app.get("/api/audio/debug/last")
@@ -298,20 +345,21 @@ async def audio_debug_last():
         return {"ok": True, "files": []}
 
     files = []
-    for name in os.listdir(tts_dir):
-        if not name.endswith(".mp3"):
-            continue
-        path = os.path.join(tts_dir, name)
-        try:
-            stat = os.stat(path)
+    with os.scandir(tts_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".mp3"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Removed between listing and stat
+                continue
             files.append({
-                "filename": name,
+                "filename": entry.name,
                 "size": stat.st_size,
                 "mtime": stat.st_mtime,
-                "url": f"/api/audio/tts/{name}",
+                "url": f"/api/audio/tts/{entry.name}",
             })
-        except Exception:
-            continue
     files.sort(key=lambda item: item["mtime"], reverse=True)
     return {"ok": True, "files": files[:10]}
 
@@ -341,16 +389,78 @@ async def audio_debug_ping(text: str = "This is a Vuddy ElevenLabs audio diagnos
 
 # ── WebSocket ────────────────────────────────────────────────────────
 
+# Outbound micro-batching for clients that connect with ?batch=1
+WS_BATCH_WINDOW_SEC = 0.005
+WS_BATCH_MAX = 32
+
+
+class _BatchedSocket:
+    """
+    Queues encoded JSON text frames and sends them from a single writer task.
+    Frames queued within WS_BATCH_WINDOW_SEC of each other go out as one JSON
+    array frame; a lone frame is sent unchanged.
+    """
+
+    def __init__(self, ws: WebSocket):
+        self._ws = ws
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._error: Exception | None = None
+        self._writer = asyncio.create_task(self._run())
+
+    async def send_text(self, frame: str) -> None:
+        # Surface a dead socket to the caller (brain marks it and stops sending)
+        if self._error is not None:
+            raise self._error
+        self._queue.put_nowait(frame)
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(WS_BATCH_WINDOW_SEC)
+            while len(batch) < WS_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            frame = batch[0] if len(batch) == 1 else f"[{','.join(batch)}]"
+            try:
+                await self._ws.send_text(frame)
+            except Exception as e:
+                self._error = e
+                return
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def aclose(self, drain_timeout: float = 1.0) -> None:
+        """Flush queued frames (bounded by drain_timeout), then stop the writer."""
+        if not self._writer.done():
+            # The writer exits early if the socket fails mid-drain
+            drained = asyncio.ensure_future(self._queue.join())
+            await asyncio.wait(
+                {drained, self._writer}, timeout=drain_timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            drained.cancel()
+        self._writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer
+
+
+async def _send_json(ws: WebSocket | _BatchedSocket, data: dict) -> None:
+    """Send a JSON text frame encoded with orjson."""
+    await ws.send_text(orjson.dumps(data).decode())
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     """
     WebSocket endpoint for real-time communication with frontend.
     """
     await ws.accept()
+    # Batch-aware clients opt in; others keep one JSON object per frame
+    out = _BatchedSocket(ws) if ws.query_params.get("batch") == "1" else ws
 
     # On connect: send initial state
     school = school_config.get_school()
-    await ws.send_json({
+    await _send_json(out, {
         "type": "assistant_state",
         "state": "idle",
         "wake_word": os.getenv("WAKE_WORD", "hey vuddy"),
@@ -365,7 +475,7 @@ async def websocket_endpoint(ws: WebSocket):
 
     async def set_idle_state():
         try:
-            await ws.send_json({"type": "assistant_state", "state": "idle"})
+            await _send_json(out, {"type": "assistant_state", "state": "idle"})
         except Exception:
             pass
         if hardware:
@@ -385,7 +495,7 @@ async def websocket_endpoint(ws: WebSocket):
 
     async def run_turn(text: str):
         try:
-            await brain.process_message(text, ws, llm_provider, hardware)
+            await brain.process_message(text, out, llm_provider, hardware)
         except asyncio.CancelledError:
             # Interruption is expected; keep it silent.
             raise
@@ -396,7 +506,7 @@ async def websocket_endpoint(ws: WebSocket):
 
     try:
         while True:
-            data = await ws.receive_json()
+            data = orjson.loads(await ws.receive_text())
             msg_type = data.get("type", "")
 
             if msg_type in ("transcript_final", "chat"):
@@ -408,12 +518,12 @@ async def websocket_endpoint(ws: WebSocket):
             elif msg_type == "start_listening":
                 if hardware:
                     await hardware.set_led_state("listening")
-                await ws.send_json({"type": "assistant_state", "state": "listening"})
+                await _send_json(out, {"type": "assistant_state", "state": "listening"})
 
             elif msg_type == "stop_listening":
                 if hardware:
                     await hardware.set_led_state("idle")
-                await ws.send_json({"type": "assistant_state", "state": "idle"})
+                await _send_json(out, {"type": "assistant_state", "state": "idle"})
 
             elif msg_type == "interrupt":
                 await cancel_current_turn()
@@ -426,10 +536,13 @@ async def websocket_endpoint(ws: WebSocket):
         print(f"[WS] Error: {e}")
         await cancel_current_turn()
         try:
-            await ws.send_json({
+            await _send_json(out, {
                 "type": "error",
                 "message": str(e),
                 "recoverable": True,
             })
         except Exception:
             pass
+    finally:
+        if out is not ws:
+            await out.aclose()
@@ -4,9 +4,10 @@ JSON file at data/profile/user_profile.json.
 Privacy: only update when user explicitly confirms.
 """
 
-import json
 import os
 
+import orjson
+
 PROFILE_FILE = os.path.join("data", "profile", "user_profile.json")
 
 DEFAULT_PROFILE = {
@@ -16,22 +17,31 @@ DEFAULT_PROFILE = {
     "preferences": {},
 }
 
+# Last parsed profile and the file mtime it was read at; reused until the file changes
+_cached_profile: dict | None = None
+_cached_mtime: int | None = None
+
 
 def load_profile() -> dict:
     """Load user profile from JSON file. Returns default if file doesn't exist."""
+    global _cached_profile, _cached_mtime
     try:
-        with open(PROFILE_FILE, "r") as f:
-            profile = json.load(f)
+        mtime = os.stat(PROFILE_FILE).st_mtime_ns
+        if _cached_profile is not None and mtime == _cached_mtime:
+            return dict(_cached_profile)
+        with open(PROFILE_FILE, "rb") as f:
+            profile = orjson.loads(f.read())
             # Ensure all default keys exist
             for key, default_val in DEFAULT_PROFILE.items():
                 if key not in profile:
                     profile[key] = default_val
-            return profile
+            _cached_profile, _cached_mtime = profile, mtime
+            return dict(profile)
     except FileNotFoundError:
         # Create default profile
         save_profile(DEFAULT_PROFILE)
         return dict(DEFAULT_PROFILE)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"[PROFILE] Invalid JSON in {PROFILE_FILE}, resetting to default")
         save_profile(DEFAULT_PROFILE)
         return dict(DEFAULT_PROFILE)
@@ -39,9 +49,11 @@ def load_profile() -> dict:
 
 def save_profile(profile: dict) -> None:
     """Save user profile to JSON file."""
+    global _cached_profile, _cached_mtime
     os.makedirs(os.path.dirname(PROFILE_FILE), exist_ok=True)
-    with open(PROFILE_FILE, "w") as f:
-        json.dump(profile, f, indent=2)
+    with open(PROFILE_FILE, "wb") as f:
+        f.write(orjson.dumps(profile, option=orjson.OPT_INDENT_2))
+    _cached_profile, _cached_mtime = dict(profile), os.stat(PROFILE_FILE).st_mtime_ns
 
 
 def update_profile(updates: dict) -> dict:
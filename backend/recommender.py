@@ -3,75 +3,66 @@ Vuddy Backend — Personalized Recommendations.
 Scores events by interest match (keyword overlap) against user profile.
 """
 
+import asyncio
+import heapq
+
 from backend import events_service, profile_store
 
+# Seed ranges pooled when the discovery feed comes back empty
+_FALLBACK_RANGES = ("today", "tomorrow", "this weekend")
+
 
 async def get_recommendations(count: int = 3) -> dict:
     """
     Get personalized event recommendations based on user interests.
     Returns: {ok: bool, events: [...], reasons: [...]}
     """
-    try:
-        # Load user profile
-        profile = profile_store.load_profile()
-        user_interests = set(
-            i.lower() for i in profile.get("interests", [])
-        )
-
-        # Pull from curated discovery feed first; fallback to seeded ranges if needed.
-        all_events = []
-        discover = await events_service.discover_events(size=20)
-        if discover.get("ok"):
-            all_events.extend(discover.get("events", []))
-
-        if not all_events:
-            all_events_result = events_service.get_events("today")
-            all_events = all_events_result.get("events", [])
-            for time_range in ["tomorrow", "this weekend"]:
-                more = events_service.get_events(time_range)
-                for evt in more.get("events", []):
-                    key = (evt.get("title"), evt.get("start"))
-                    if not any((e.get("title"), e.get("start")) == key for e in all_events):
-                        all_events.append(evt)
-
-        if not all_events:
-            return {"ok": True, "events": [], "reasons": []}
-
-        # Score each event by keyword overlap with user interests
+    # Load the profile (disk) while the discovery feed (network) is in flight
+    profile, discover = await asyncio.gather(
+        asyncio.to_thread(profile_store.load_profile),
+        events_service.discover_events(size=20),
+    )
+    user_interests = set(
+        i.lower() for i in profile.get("interests", [])
+    )
+
+    # Pull from curated discovery feed first; fallback to seeded ranges if needed.
+    all_events = []
+    if discover.get("ok"):
+        all_events.extend(discover.get("events", []))
+
+    if not all_events:
+        # One in-memory pass over the seed index covers every fallback range
+        pools = events_service.get_events_multi(list(_FALLBACK_RANGES))
+        seen = set()
+        for pool in pools.values():
+            for evt in pool:
+                key = (evt.get("title"), evt.get("start"))
+                if key not in seen:
+                    seen.add(key)
+                    all_events.append(evt)
+
+    if not all_events:
+        return {"ok": True, "events": [], "reasons": []}
+
+    # Score each event by keyword overlap with user interests.
+    # With no interests set, everyone gets a base score for variety.
+    if user_interests:
         scored = []
         for event in all_events:
-            event_keywords = set()
-            # Add tags
-            for tag in event.get("tags", []):
-                event_keywords.add(tag.lower())
-            # Add words from title and description
-            for field in ["title", "description"]:
-                for word in event.get(field, "").lower().split():
-                    if len(word) > 3:  # Skip short words
-                        event_keywords.add(word)
-
-            overlap = user_interests & event_keywords
-            score = len(overlap)
-
-            # If no interests set, give everyone a base score for variety
-            if not user_interests:
-                score = 1
-
-            reason = _generate_reason(event, overlap, user_interests)
-            scored.append((score, event, reason))
-
-        # Sort by score descending, take top N
-        scored.sort(key=lambda x: x[0], reverse=True)
-        top = scored[:count]
-
-        events = [item[1] for item in top]
-        reasons = [item[2] for item in top]
-
-        return {"ok": True, "events": events, "reasons": reasons}
-
-    except Exception as e:
-        print(f"[RECOMMENDER] Error: {e}")
-        return {"ok": False, "events": [], "reasons": [], "error": str(e)}
+            overlap = user_interests & events_service.event_keywords(event)
+            scored.append((len(overlap), event, overlap))
+    else:
+        scored = [(1, event, set()) for event in all_events]
+
+    # Top N by score; ties keep pool order
+    top = heapq.nlargest(count, scored, key=lambda x: x[0])
+
+    # Reasons are only worded for the events actually returned
+    events = [item[1] for item in top]
+    reasons = [_generate_reason(event, overlap, user_interests) for _, event, overlap in top]
+
+    return {"ok": True, "events": events, "reasons": reasons}
 
 
 def _generate_reason(event: dict, overlap: set, user_interests: set) -> str:
@@ -5,10 +5,14 @@ backend adjusts system prompt and school-specific details.
 """
 
 import os
+from functools import lru_cache
 
 # Default school from env, can be overridden per-session via API
 ACTIVE_SCHOOL = os.getenv("SCHOOL", "gmu")
 
+# Bumped whenever the active school changes, so callers can cache derived prompts
+_version = 0
+
 
 # School profiles: mascot, colors, locations, personality flavor
 SCHOOLS = {
@@ -99,20 +103,44 @@ SCHOOLS = {
 }
 
 
+# Lookup index by normalized ID; exact IDs hit without allocating a normalized copy
+_BY_ID = {sid.lower(): school for sid, school in SCHOOLS.items()}
+
+
+def _normalize_id(school_id: str) -> str | None:
+    """Return the canonical school ID, or None if unknown."""
+    if school_id in _BY_ID:
+        return school_id
+    sid = school_id.lower().strip()
+    return sid if sid in _BY_ID else None
+
+
+@lru_cache(maxsize=8)
 def get_school(school_id: str | None = None) -> dict:
     """Get school config by ID. Falls back to active school, then GMU."""
-    sid = (school_id or ACTIVE_SCHOOL).lower().strip()
-    return SCHOOLS.get(sid, SCHOOLS["gmu"])
+    sid = _normalize_id(school_id or ACTIVE_SCHOOL)
+    return _BY_ID[sid] if sid else _BY_ID["gmu"]
 
 
 def set_active_school(school_id: str) -> dict:
     """Set the active school for this session."""
-    global ACTIVE_SCHOOL
-    sid = school_id.lower().strip()
-    if sid not in SCHOOLS:
+    global ACTIVE_SCHOOL, _version
+    sid = _normalize_id(school_id)
+    if sid is None:
         return {"ok": False, "error": f"Unknown school: {school_id}", "valid": list(SCHOOLS.keys())}
-    ACTIVE_SCHOOL = sid
-    return {"ok": True, "school": SCHOOLS[sid]["name"], "short": SCHOOLS[sid]["short"]}
+    school = _BY_ID[sid]
+    if sid != ACTIVE_SCHOOL:
+        ACTIVE_SCHOOL = sid
+        _version += 1
+        # Both lookups read ACTIVE_SCHOOL when called without an ID
+        get_school.cache_clear()
+        get_school_prompt_context.cache_clear()
+    return {"ok": True, "school": school["name"], "short": school["short"]}
+
+
+def get_version() -> int:
+    """Version counter for the active school selection."""
+    return _version
 
 
 def list_schools() -> dict:
@@ -126,6 +154,7 @@ def list_schools() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
 def get_school_prompt_context() -> str:
     """Generate school-specific context for the LLM system prompt."""
     school = get_school()
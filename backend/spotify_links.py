@@ -3,28 +3,30 @@ Vuddy Backend — Spotify Link Generator.
 No OAuth required. Generates Spotify search URLs.
 """
 
+import string
 from urllib.parse import quote
 
+SPOTIFY_SEARCH_URL = "https://open.spotify.com/search/"
+
+# Percent-encoding for ASCII input, matching quote()'s default safe set ("/")
+_SAFE_CHARS = string.ascii_letters + string.digits + "_.-~/"
+_PERCENT_MAP = str.maketrans({
+    chr(c): f"%{c:02X}" for c in range(128) if chr(c) not in _SAFE_CHARS
+})
+
 
 def search_link(query: str) -> dict:
     """
     Generate a Spotify search URL for the given query.
     Returns: {ok: bool, url: str, display_text: str}
     """
-    try:
-        if not query or not query.strip():
-            return {"ok": False, "error": "Empty query"}
-
-        encoded_query = quote(query.strip())
-        url = f"https://open.spotify.com/search/{encoded_query}"
-        display_text = f"Open in Spotify: {query.strip()}"
-
-        return {
-            "ok": True,
-            "url": url,
-            "display_text": display_text,
-        }
+    q = query.strip() if isinstance(query, str) else ""
+    if not q:
+        return {"ok": False, "error": "Empty query"}
 
-    except Exception as e:
-        print(f"[SPOTIFY] Error: {e}")
-        return {"ok": False, "error": str(e)}
+    encoded_query = q.translate(_PERCENT_MAP) if q.isascii() else quote(q)
+    return {
+        "ok": True,
+        "url": SPOTIFY_SEARCH_URL + encoded_query,
+        "display_text": f"Open in Spotify: {q}",
+    }
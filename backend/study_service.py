@@ -3,11 +3,13 @@ Vuddy Backend — Study Session Timer.
 In-memory session store. Pomodoro-style study sessions.
 """
 
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# In-memory session store
+# In-memory session store, plus the IDs of sessions still running (dict keeps start order)
 _sessions: dict[str, dict] = {}
+_active_ids: dict[str, None] = {}
 
 
 def start_session(topic: str, duration_min: int = 25) -> dict:
@@ -15,29 +17,30 @@ def start_session(topic: str, duration_min: int = 25) -> dict:
     Start a new study session.
     Returns: {ok: bool, session_id: str, end_time: str}
     """
-    try:
-        session_id = f"study_{uuid.uuid4().hex[:6]}"
-        now = datetime.now()
-        end_time = now + timedelta(minutes=duration_min)
-
-        _sessions[session_id] = {
-            "session_id": session_id,
-            "topic": topic,
-            "duration_min": duration_min,
-            "start_time": now.isoformat(),
-            "end_time": end_time.isoformat(),
-            "active": True,
-        }
-
-        return {
-            "ok": True,
-            "session_id": session_id,
-            "end_time": end_time.isoformat(),
-        }
-
-    except Exception as e:
-        print(f"[STUDY] Error starting session: {e}")
-        return {"ok": False, "error": str(e)}
+    if not isinstance(duration_min, (int, float)) or duration_min <= 0:
+        return {"ok": False, "error": f"Invalid duration: {duration_min}"}
+
+    session_id = f"study_{uuid.uuid4().hex[:6]}"
+    # Monotonic clock for elapsed time; wall clock only for display
+    start_wall = time.time()
+    end_wall = start_wall + duration_min * 60
+
+    _sessions[session_id] = {
+        "session_id": session_id,
+        "topic": topic,
+        "duration_min": duration_min,
+        "start_mono": time.monotonic(),
+        "start_wall": start_wall,
+        "end_wall": end_wall,
+        "active": True,
+    }
+    _active_ids[session_id] = None
+
+    return {
+        "ok": True,
+        "session_id": session_id,
+        "end_time": _iso(end_wall),
+    }
 
 
 def stop_session(session_id: str) -> dict:
@@ -45,31 +48,46 @@ def stop_session(session_id: str) -> dict:
     Stop an active study session.
     Returns: {ok: bool, elapsed_min: float}
     """
-    try:
-        session = _sessions.get(session_id)
-        if not session:
-            return {"ok": False, "error": f"Session {session_id} not found"}
+    session = _sessions.get(session_id)
+    if not session:
+        return {"ok": False, "error": f"Session {session_id} not found"}
 
-        if not session["active"]:
-            return {"ok": False, "error": f"Session {session_id} already stopped"}
+    if not session["active"]:
+        return {"ok": False, "error": f"Session {session_id} already stopped"}
 
-        session["active"] = False
-        start_time = datetime.fromisoformat(session["start_time"])
-        elapsed = (datetime.now() - start_time).total_seconds() / 60.0
+    session["active"] = False
+    _active_ids.pop(session_id, None)
+    elapsed = (time.monotonic() - session["start_mono"]) / 60.0
 
-        session["elapsed_min"] = round(elapsed, 1)
-        session["stopped_at"] = datetime.now().isoformat()
+    session["elapsed_min"] = round(elapsed, 1)
+    session["stopped_wall"] = time.time()
 
-        return {
-            "ok": True,
-            "elapsed_min": round(elapsed, 1),
-        }
-
-    except Exception as e:
-        print(f"[STUDY] Error stopping session: {e}")
-        return {"ok": False, "error": str(e)}
+    return {
+        "ok": True,
+        "elapsed_min": round(elapsed, 1),
+    }
 
 
 def get_active_sessions() -> list[dict]:
     """Get all currently active study sessions."""
-    return [s for s in _sessions.values() if s.get("active")]
+    return [_serialize(_sessions[sid]) for sid in _active_ids]
+
+
+def _serialize(session: dict) -> dict:
+    """Client view of a session with ISO timestamps in place of epoch floats."""
+    out = {
+        "session_id": session["session_id"],
+        "topic": session["topic"],
+        "duration_min": session["duration_min"],
+        "start_time": _iso(session["start_wall"]),
+        "end_time": _iso(session["end_wall"]),
+        "active": session["active"],
+    }
+    if "elapsed_min" in session:
+        out["elapsed_min"] = session["elapsed_min"]
+        out["stopped_at"] = _iso(session["stopped_wall"])
+    return out
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts).isoformat()
@@ -1,13 +1,18 @@
 """
 Vuddy Backend — Tool Router.
 7 tools as OpenAI-compatible function definitions.
-Max 2 tool calls per turn. 1 retry on failure.
+Max 2 tool calls per turn. 1 retry on failure for read-only tools.
 """
 
 import asyncio
-import json
+import logging
+import sys
+import time
+from collections import OrderedDict
 
-from backend.constants import TOOL_NAMES
+import orjson
+
+from backend.constants import TOOL_NAMES_SET
 from backend import events_service, recommender, calendar_service, study_service, spotify_links
 
 # OpenAI-compatible tool definitions for the LLM
@@ -140,87 +145,227 @@ TOOL_DEFINITIONS = [
 
 # Timeout per tool (seconds), matching shared/tools.schema.json
 TOOL_TIMEOUTS = {
-    "get_events": 2,
-    "get_recommendations": 3,
-    "get_calendar_summary": 2,
-    "add_calendar_item": 2,
-    "start_study_session": 1,
-    "stop_study_session": 1,
-    "spotify_search_link": 1,
+    "get_events": 2.0,
+    "get_recommendations": 3.0,
+    "get_calendar_summary": 2.0,
+    "add_calendar_item": 2.0,
+    "start_study_session": 1.0,
+    "stop_study_session": 1.0,
+    "spotify_search_link": 1.0,
 }
+DEFAULT_TOOL_TIMEOUT = 2.0
+
+log = logging.getLogger("vuddy.tools")
 
 MAX_TOOL_CALLS_PER_TURN = 2
 MAX_RETRIES = 1
 
+# Read-only tools that are safe to re-run after a timeout or error. Mutating tools
+# (calendar add, study start/stop) get one attempt so a retry can't duplicate the effect.
+_RETRYABLE = frozenset({"get_events", "get_recommendations", "get_calendar_summary", "spotify_search_link"})
+
+# Pure in-memory tools: called inline, without the timeout/retry/cache scaffolding
+_INLINE_TOOLS = frozenset({"spotify_search_link"})
+
+# Seconds a successful result is reused for identical arguments (deterministic tools only)
+_RESULT_TTL_SEC = {"get_events": 5.0, "get_recommendations": 5.0}
+_RESULT_CACHE_MAX = 128
+_result_cache: OrderedDict[tuple[str, bytes], tuple[float, dict]] = OrderedDict()
+
+# Tools that must observe another tool's effect when both run in one turn
+_TOOL_DEPENDS_ON = {
+    "get_calendar_summary": {"add_calendar_item"},
+    "stop_study_session": {"start_study_session"},
+}
+
+
+def format_tool_result(result: dict) -> str:
+    """
+    Encode a tool result for the LLM's tool message. Lists of same-shaped flat
+    records become "<key>_toon": a header line of field names, then one
+    pipe-delimited row per record. Anything else stays JSON, minus empty fields.
+    """
+    compact = {}
+    for key, value in result.items():
+        fields = _uniform_fields(value)
+        if fields:
+            compact[f"{key}_toon"] = _encode_rows(value, fields)
+        elif value is not None and value != "":
+            # Top-level empty lists stay: "events": [] tells the model nothing matched
+            compact[key] = _strip_empty(value)
+    return orjson.dumps(compact).decode()
+
+
+def _is_empty(value) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _strip_empty(value):
+    """Drop None/""/[]/{} fields recursively; they cost tokens and carry no meaning."""
+    if isinstance(value, dict):
+        return {k: _strip_empty(v) for k, v in value.items() if not _is_empty(v)}
+    if isinstance(value, list):
+        return [_strip_empty(v) for v in value]
+    return value
+
+
+def _uniform_fields(value) -> tuple[str, ...] | None:
+    """Field names shared by every record, or None if value isn't a uniform list of flat dicts."""
+    if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+        return None
+    fields = tuple(value[0])
+    for row in value:
+        if not isinstance(row, dict) or tuple(row) != fields:
+            return None
+        for cell in row.values():
+            if isinstance(cell, dict) or (isinstance(cell, list) and any(isinstance(x, (dict, list)) for x in cell)):
+                return None
+    return fields
+
+
+def _toon_cell(cell) -> str:
+    if cell is None:
+        return ""
+    if isinstance(cell, list):
+        cell = ",".join(map(str, cell))
+    return str(cell).replace("|", "/").replace("\n", " ")
+
+
+def _encode_rows(rows: list[dict], fields: tuple[str, ...]) -> str:
+    lines = ["|".join(fields)]
+    lines.extend("|".join(_toon_cell(row[f]) for f in fields) for row in rows)
+    return "\n".join(lines)
+
 
 async def execute_tool(tool_name: str, arguments: dict) -> dict:
     """
     Execute a tool by name with the given arguments.
-    Includes timeout and 1 retry on failure.
+    Includes timeout and 1 retry on failure for read-only tools; mutating tools
+    are not retried, since the first attempt may have applied before failing.
     """
-    if tool_name not in TOOL_NAMES:
+    if tool_name not in TOOL_NAMES_SET:
         return {"ok": False, "error": f"Unknown tool: {tool_name}"}
 
-    timeout = TOOL_TIMEOUTS.get(tool_name, 2)
+    if tool_name in _INLINE_TOOLS:
+        try:
+            return _SYNC_TOOLS[tool_name](arguments)
+        except (KeyError, TypeError) as e:
+            return {"ok": False, "error": f"Bad arguments: {e}"}
+        except Exception as e:
+            # Same contract as the timed path: failures become tool results, never raise
+            return {"ok": False, "error": str(e)}
+
+    ttl = _RESULT_TTL_SEC.get(tool_name)
+    cache_key = None
+    if ttl is not None:
+        try:
+            cache_key = (tool_name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+        except TypeError:
+            pass
+        else:
+            entry = _result_cache.get(cache_key)
+            if entry and entry[0] > time.monotonic():
+                _result_cache.move_to_end(cache_key)
+                return entry[1]
 
-    for attempt in range(MAX_RETRIES + 1):
+    timeout = TOOL_TIMEOUTS.get(tool_name, DEFAULT_TOOL_TIMEOUT)
+    max_retries = MAX_RETRIES if tool_name in _RETRYABLE else 0
+
+    for attempt in range(max_retries + 1):
         try:
-            result = await asyncio.wait_for(
-                _run_tool(tool_name, arguments),
-                timeout=timeout,
-            )
+            result = await _run_with_timeout(tool_name, arguments, timeout)
+            if cache_key is not None and result.get("ok"):
+                _result_cache[cache_key] = (time.monotonic() + ttl, result)
+                _result_cache.move_to_end(cache_key)
+                if len(_result_cache) > _RESULT_CACHE_MAX:
+                    _result_cache.popitem(last=False)
             return result
         except asyncio.TimeoutError:
-            if attempt < MAX_RETRIES:
-                print(f"[TOOLS] {tool_name} timed out, retrying ({attempt + 1}/{MAX_RETRIES})")
+            if attempt < max_retries:
+                log.warning("%s timed out, retrying (%d/%d)", tool_name, attempt + 1, max_retries)
                 continue
             return {"ok": False, "error": "timeout"}
         except Exception as e:
-            if attempt < MAX_RETRIES:
-                print(f"[TOOLS] {tool_name} failed ({e}), retrying ({attempt + 1}/{MAX_RETRIES})")
+            if attempt < max_retries:
+                log.warning("%s failed (%s), retrying (%d/%d)", tool_name, e, attempt + 1, max_retries)
                 continue
             return {"ok": False, "error": str(e)}
 
 
+async def execute_tools(calls: list[tuple[str, dict]]) -> list[dict]:
+    """
+    Execute a turn's tool calls, each with its own timeout. Independent calls run
+    concurrently; results come back in call order.
+    """
+    if len(calls) == 1:
+        # The common single-call turn: no dependency check or gather needed
+        tool_name, arguments = calls[0]
+        return [await execute_tool(tool_name, arguments)]
+
+    names = {tool_name for tool_name, _ in calls}
+    if any(_TOOL_DEPENDS_ON.get(tool_name, set()) & names for tool_name in names):
+        # One call depends on another's effect: keep them in order
+        return [await execute_tool(tool_name, arguments) for tool_name, arguments in calls]
+
+    results = await asyncio.gather(
+        *(execute_tool(tool_name, arguments) for tool_name, arguments in calls),
+        return_exceptions=True,
+    )
+    return [
+        {"ok": False, "error": str(result)} if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+
+if sys.version_info >= (3, 11):
+    async def _run_with_timeout(tool_name: str, arguments: dict, timeout: float) -> dict:
+        # Runs in the caller's task; wait_for would wrap each call in a new Task
+        async with asyncio.timeout(timeout):
+            return await _run_tool(tool_name, arguments)
+else:
+    async def _run_with_timeout(tool_name: str, arguments: dict, timeout: float) -> dict:
+        return await asyncio.wait_for(_run_tool(tool_name, arguments), timeout=timeout)
+
+
 async def _run_tool(tool_name: str, arguments: dict) -> dict:
     """Route to the correct tool implementation."""
-    if tool_name == "get_events":
-        return events_service.get_events(
-            time_range=arguments.get("time_range", "today"),
-            tags=arguments.get("tags"),
-        )
-
-    elif tool_name == "get_recommendations":
-        return await recommender.get_recommendations(
-            count=arguments.get("count", 3),
-        )
-
-    elif tool_name == "get_calendar_summary":
-        return calendar_service.get_summary(
-            hours_ahead=arguments.get("hours_ahead", 24),
-        )
-
-    elif tool_name == "add_calendar_item":
-        return calendar_service.add_item(
-            title=arguments["title"],
-            time_iso=arguments["time_iso"],
-            notes=arguments.get("notes", ""),
-        )
-
-    elif tool_name == "start_study_session":
-        return study_service.start_session(
-            topic=arguments["topic"],
-            duration_min=arguments.get("duration_min", 25),
-        )
-
-    elif tool_name == "stop_study_session":
-        return study_service.stop_session(
-            session_id=arguments["session_id"],
-        )
-
-    elif tool_name == "spotify_search_link":
-        return spotify_links.search_link(
-            query=arguments["query"],
-        )
-
+    handler = _ASYNC_TOOLS.get(tool_name)
+    if handler is not None:
+        return await handler(arguments)
+    handler = _SYNC_TOOLS.get(tool_name)
+    if handler is not None:
+        return handler(arguments)
     return {"ok": False, "error": f"Unknown tool: {tool_name}"}
+
+
+# Tool name -> adapter that maps LLM arguments onto the service call
+_SYNC_TOOLS = {
+    "get_events": lambda args: events_service.get_events(
+        time_range=args.get("time_range", "today"),
+        tags=args.get("tags"),
+    ),
+    "get_calendar_summary": lambda args: calendar_service.get_summary(
+        hours_ahead=args.get("hours_ahead", 24),
+    ),
+    "add_calendar_item": lambda args: calendar_service.add_item(
+        title=args["title"],
+        time_iso=args["time_iso"],
+        notes=args.get("notes", ""),
+    ),
+    "start_study_session": lambda args: study_service.start_session(
+        topic=args["topic"],
+        duration_min=args.get("duration_min", 25),
+    ),
+    "stop_study_session": lambda args: study_service.stop_session(
+        session_id=args["session_id"],
+    ),
+    "spotify_search_link": lambda args: spotify_links.search_link(
+        query=args["query"],
+    ),
+}
+
+_ASYNC_TOOLS = {
+    "get_recommendations": lambda args: recommender.get_recommendations(
+        count=args.get("count", 3),
+    ),
+}
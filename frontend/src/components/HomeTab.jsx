@@ -115,6 +115,7 @@ export default function HomeTab({ sendMessage, lastMessage, assistantState, scho
     const {
         audioState,
         playAudio,
+        enqueueAudio,
         stopAudio,
         pauseAudio,
         resumeAudio,
@@ -344,7 +345,12 @@ export default function HomeTab({ sendMessage, lastMessage, assistantState, scho
 
             case WS_RECV_TYPES.ASSISTANT_AUDIO_READY:
                 if (autoSpeak) {
-                    playAudio(lastMessage.audio_url, lastMessage.audio_b64, lastMessage.format);
+                    // seq > 0: later sentence of the same reply, play after the current clip
+                    if (lastMessage.seq > 0) {
+                        enqueueAudio(lastMessage.audio_url, lastMessage.audio_b64, lastMessage.format);
+                    } else {
+                        playAudio(lastMessage.audio_url, lastMessage.audio_b64, lastMessage.format);
+                    }
                 }
                 break;
 
@@ -368,7 +374,7 @@ export default function HomeTab({ sendMessage, lastMessage, assistantState, scho
             default:
                 break;
         }
-    }, [lastMessage, playAudio, autoSpeak, appendMessageToConversation]);
+    }, [lastMessage, playAudio, enqueueAudio, autoSpeak, appendMessageToConversation]);
 
     useEffect(() => {
         if (conversationRef.current) {
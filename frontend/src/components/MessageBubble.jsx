@@ -10,7 +10,11 @@ export default function MessageBubble({ message }) {
             {tool_results && tool_results.length > 0 && (
                 <div className="message-bubble__tool-results">
                     {tool_results.map((tr, i) => (
-                        <div key={i}>🔧 {tr.tool}: {tr.summary}</div>
+                        <div key={i}>
+                            🔧 {tr.tool}: {tr.url ? (
+                                <a href={tr.url} target="_blank" rel="noopener noreferrer">{tr.summary}</a>
+                            ) : tr.summary}
+                        </div>
                     ))}
                 </div>
             )}
@@ -72,4 +72,4 @@ export const API = {
 export const WS_URL =
     (window.location.protocol === 'https:' ? 'wss://' : 'ws://') +
     window.location.host +
-    '/ws';
+    '/ws?batch=1';
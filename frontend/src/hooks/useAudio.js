@@ -63,6 +63,10 @@ export function useAudio(audioContextRef) {
     const objectUrlRef = useRef(null);
     const playbackTokenRef = useRef(0);
     const pendingAudioRef = useRef(null);
+    // Sentence clips queued behind the one currently playing.
+    const queueRef = useRef([]);
+    const busyRef = useRef(false);
+    const playAudioRef = useRef(null);
 
     const cleanupObjectUrl = useCallback(() => {
         if (objectUrlRef.current) {
@@ -93,6 +97,8 @@ export function useAudio(audioContextRef) {
     }, []);
 
     const stopAudio = useCallback(() => {
+        queueRef.current = [];
+        busyRef.current = false;
         playbackTokenRef.current += 1;
         if (audioElRef.current) {
             audioElRef.current.pause();
@@ -161,8 +167,11 @@ export function useAudio(audioContextRef) {
         }
     }, []);
 
-    const playAudio = useCallback(async (audioUrl, audioB64, format) => {
+    const playAudio = useCallback(async (audioUrl, audioB64, format, { keepQueue = false } = {}) => {
+        const queued = keepQueue ? queueRef.current : [];
         stopAudio();
+        queueRef.current = queued;
+        busyRef.current = true;
         const token = playbackTokenRef.current;
         setAudioState(AUDIO_STATE.LOADING);
         setLastAudioError('');
@@ -184,6 +193,13 @@ export function useAudio(audioContextRef) {
             }
 
             if (!src) {
+                // Nothing to play for this clip; move on so later clips aren't stuck behind it
+                const next = queueRef.current.shift();
+                if (next) {
+                    playAudioRef.current(next.audioUrl, next.audioB64, next.format, { keepQueue: true });
+                    return;
+                }
+                busyRef.current = false;
                 setAudioState(AUDIO_STATE.IDLE);
                 return;
             }
@@ -199,6 +215,12 @@ export function useAudio(audioContextRef) {
                     audioEl.onended = () => {
                         if (playbackTokenRef.current !== token) return;
                         cleanupObjectUrl();
+                        const next = queueRef.current.shift();
+                        if (next) {
+                            playAudioRef.current(next.audioUrl, next.audioB64, next.format, { keepQueue: true });
+                            return;
+                        }
+                        busyRef.current = false;
                         setAudioState(AUDIO_STATE.IDLE);
                     };
                     await audioEl.play();
@@ -256,9 +278,21 @@ export function useAudio(audioContextRef) {
             if (e?.name === 'NotAllowedError' || e?.name === 'AbortError') {
                 setAutoplayBlocked(true);
             }
+            queueRef.current = [];
+            busyRef.current = false;
             setAudioState(AUDIO_STATE.IDLE);
         }
     }, [stopAudio, cleanupObjectUrl, getOrCreateAudioEl]);
+    playAudioRef.current = playAudio;
+
+    // Follow-up sentence clips wait for the current clip instead of interrupting it.
+    const enqueueAudio = useCallback((audioUrl, audioB64, format) => {
+        if (busyRef.current) {
+            queueRef.current.push({ audioUrl, audioB64, format });
+            return;
+        }
+        playAudio(audioUrl, audioB64, format);
+    }, [playAudio]);
 
     const playPendingAudio = useCallback(async () => {
         if (!pendingAudioRef.current) return;
@@ -270,6 +304,7 @@ export function useAudio(audioContextRef) {
     return {
         audioState,
         playAudio,
+        enqueueAudio,
         stopAudio,
         pauseAudio,
         resumeAudio,
@@ -1,4 +1,5 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
+import { flushSync } from 'react-dom';
 import { WS_RECV_TYPES, WS_URL } from '../constants';
 
 export function useWebSocket() {
@@ -25,12 +26,17 @@ export function useWebSocket() {
             ws.onmessage = (event) => {
                 if (!mountedRef.current) return;
                 try {
-                    const msg = JSON.parse(event.data);
-                    setLastMessage(msg);
+                    const data = JSON.parse(event.data);
+                    // Backend micro-batches bursts into a JSON array (WS_URL opts in with ?batch=1)
+                    const messages = Array.isArray(data) ? data : [data];
+                    for (const msg of messages) {
+                        // Commit each one so lastMessage effects see every message in a batch
+                        flushSync(() => setLastMessage(msg));
 
-                    // Extract llm_provider from initial connect message
-                    if (msg.type === WS_RECV_TYPES.ASSISTANT_STATE && msg.llm_provider) {
-                        setLlmProvider(msg.llm_provider);
+                        // Extract llm_provider from initial connect message
+                        if (msg.type === WS_RECV_TYPES.ASSISTANT_STATE && msg.llm_provider) {
+                            setLlmProvider(msg.llm_provider);
+                        }
                     }
                 } catch (e) {
                     console.error('[WS] Failed to parse message:', e);
@@ -0,0 +1,30 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Production-style backend launch: uvloop event loop + httptools HTTP parser
+# (both ship with uvicorn[standard]), and permessage-deflate on /ws so large
+# event/tool payloads are compressed for clients that negotiate it.
+# Usage:
+#   ./launch.sh
+#   WEB_CONCURRENCY=4 BACKEND_PORT=8000 ./launch.sh
+#
+# WEB_CONCURRENCY defaults to 1. Chat history, study sessions, the active
+# school and the calendar write-behind buffer live in process memory, so with
+# more than one worker each worker keeps its own copy. Only raise it if those
+# features can tolerate per-worker state (e.g. stateless API-only deployments).
+
+ROOT_DIR="$(cd "$(dirname "$0")" && pwd)"
+BACKEND_HOST="${BACKEND_HOST:-0.0.0.0}"
+BACKEND_PORT="${BACKEND_PORT:-8000}"
+WEB_CONCURRENCY="${WEB_CONCURRENCY:-1}"
+
+cd "$ROOT_DIR"
+echo "🚀 Starting backend on $BACKEND_HOST:$BACKEND_PORT ($WEB_CONCURRENCY worker(s), uvloop + httptools)"
+exec python -m uvicorn backend.main:app \
+  --host "$BACKEND_HOST" \
+  --port "$BACKEND_PORT" \
+  --loop uvloop \
+  --http httptools \
+  --ws websockets \
+  --ws-per-message-deflate true \
+  --workers "$WEB_CONCURRENCY"
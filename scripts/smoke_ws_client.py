@@ -6,11 +6,10 @@ Usage:
     python scripts/smoke_ws_client.py --url ws://localhost:8000/ws
     python scripts/smoke_ws_client.py --timeout 30
 
-Requires: pip install websockets
+Requires: pip install websockets orjson httpx
 """
 import argparse
 import asyncio
-import json
 import sys
 
 try:
@@ -19,11 +18,26 @@ except ImportError:
     print("[FAIL] websockets not installed. Run: pip install websockets")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    print("[FAIL] orjson not installed. Run: pip install orjson")
+    sys.exit(1)
+
+try:
+    import httpx
+except ImportError:
+    print("[FAIL] httpx not installed. Run: pip install httpx")
+    sys.exit(1)
+
 
 PASS = 0
 FAIL = 0
 WARN = 0
 
+# Encoded once; sent as str so it goes out as a text frame (the backend reads text)
+CHAT_FRAME = orjson.dumps({"type": "chat", "text": "what events are happening tonight?"}).decode()
+
 
 def ok(msg):
     global PASS
@@ -46,7 +60,7 @@ def warn(msg):
 async def test_connect(ws_url, timeout):
     print(f"\n1. Connecting to {ws_url}...")
     try:
-        ws = await asyncio.wait_for(websockets.connect(ws_url), timeout=5.0)
+        ws = await asyncio.wait_for(websockets.connect(ws_url, compression="deflate"), timeout=5.0)
     except Exception as e:
         fail(f"Could not connect: {e}")
         return None
@@ -55,7 +69,7 @@ async def test_connect(ws_url, timeout):
     # Expect assistant_state on connect
     try:
         raw = await asyncio.wait_for(ws.recv(), timeout=5.0)
-        msg = json.loads(raw)
+        msg = orjson.loads(raw)
     except Exception as e:
         fail(f"No initial message: {e}")
         return ws
@@ -79,37 +93,29 @@ async def test_connect(ws_url, timeout):
 
 async def test_chat(ws, timeout):
     print("\n2. Sending chat message...")
-    await ws.send(json.dumps({"type": "chat", "text": "what events are happening tonight?"}))
+    await ws.send(CHAT_FRAME)
     ok("Sent chat message")
 
     print("\n3. Collecting responses...")
+    # Sentence clips (assistant_audio_ready) can arrive before, around and after
+    # assistant_text, so read until the text is in and no more clips follow.
     received_types = []
     try:
         while True:
-            raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
-            msg = json.loads(raw)
+            wait = 5.0 if "assistant_text" in received_types else timeout
+            raw = await asyncio.wait_for(ws.recv(), timeout=wait)
+            msg = orjson.loads(raw)
             msg_type = msg.get("type", "unknown")
             received_types.append(msg_type)
-            preview = json.dumps(msg)[:150]
+            preview = orjson.dumps(msg).decode()[:150]
             print(f"  [RECV] {msg_type}: {preview}")
 
-            if msg_type == "assistant_audio_ready":
-                break
             if msg_type == "error":
                 warn(f"Error from backend: {msg.get('message')}")
                 break
-            if msg_type == "assistant_text" and "assistant_audio_ready" not in received_types:
-                # Text came but audio might not come (ElevenLabs not configured)
-                try:
-                    raw2 = await asyncio.wait_for(ws.recv(), timeout=5.0)
-                    msg2 = json.loads(raw2)
-                    received_types.append(msg2.get("type"))
-                    print(f"  [RECV] {msg2.get('type')}: {json.dumps(msg2)[:150]}")
-                except asyncio.TimeoutError:
-                    pass
-                break
     except asyncio.TimeoutError:
-        warn("Timed out waiting for responses")
+        if "assistant_text" not in received_types:
+            warn("Timed out waiting for responses")
 
     print("\n4. Verifying message flow...")
     if "assistant_state" in received_types:
@@ -129,12 +135,12 @@ async def test_chat(ws, timeout):
 
 
 async def test_health(base_url):
-    import urllib.request
     print("\n5. Checking REST health endpoint...")
     try:
         url = base_url.replace("ws://", "http://").replace("/ws", "/health")
-        req = urllib.request.urlopen(url, timeout=5)
-        data = json.loads(req.read())
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            resp = await client.get(url)
+        data = orjson.loads(resp.content)
         if data.get("ok"):
             ok(f"Health OK: provider={data.get('llm_provider')}, hardware={data.get('hardware_mode')}")
         else:
@@ -1,14 +1,16 @@
 import asyncio
 import os
 import sys
-import json
 import httpx
+import orjson
 import websockets
 # from termcolor import colored
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 WS_URL = "ws://localhost:8000/ws"
+# Encoded once; sent as str so it goes out as a text frame (the backend reads text)
+CHAT_FRAME = orjson.dumps({"type": "chat", "text": "Hello Vuddy"}).decode()
 
 REQUIRED_FILES = [
     "backend/__init__.py",
@@ -34,11 +36,23 @@ REQUIRED_FILES = [
 def log(msg, color="white"):
     print(msg)
 
+def _list_present(paths):
+    """One directory listing per parent dir instead of one stat per required file."""
+    present = set()
+    for parent in {os.path.dirname(p) or "." for p in paths}:
+        if not os.path.isdir(parent):
+            continue
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                present.add(os.path.normpath(os.path.join(parent, entry.name)))
+    return present
+
 def check_files():
     log("--- 1. File Structure Check ---", "cyan")
+    present = _list_present(REQUIRED_FILES)
     missing = []
     for f in REQUIRED_FILES:
-        if os.path.exists(f):
+        if os.path.normpath(f) in present:
             log(f"✅ Found {f}", "green")
         else:
             log(f"❌ MISSING {f}", "red")
@@ -47,12 +61,13 @@ def check_files():
 
 async def check_api():
     log("\n--- 2. REST API Check ---", "cyan")
-    async with httpx.AsyncClient(base_url=BASE_URL, timeout=5.0) as client:
+    limits = httpx.Limits(max_keepalive_connections=10)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=5.0, limits=limits) as client:
         # Health
         try:
             r = await client.get("/health")
             if r.status_code == 200:
-                data = r.json()
+                data = orjson.loads(r.content)
                 log(f"✅ /health: OK (LLM={data.get('llm_provider')}, TTS={data.get('elevenlabs')})", "green")
             else:
                 log(f"❌ /health: Failed ({r.status_code})", "red")
@@ -61,31 +76,36 @@ async def check_api():
             log(f"❌ Server unreachable: {e}", "red")
             return False
 
+        # Remaining endpoints are independent: issue them together over the pooled client
+        r_events, r_calendar, r_profile, r_school = await asyncio.gather(
+            client.get("/api/events"),
+            client.get("/api/calendar/summary"),
+            client.get("/api/profile"),
+            client.get("/api/school"),
+        )
+
         # Events
-        r = await client.get("/api/events")
-        if r.status_code == 200 and isinstance(r.json(), list):
-            log(f"✅ /api/events: OK ({len(r.json())} items)", "green")
+        events = orjson.loads(r_events.content) if r_events.status_code == 200 else None
+        if isinstance(events, list):
+            log(f"✅ /api/events: OK ({len(events)} items)", "green")
         else:
             log(f"❌ /api/events: Failed", "red")
 
         # Calendar
-        r = await client.get("/api/calendar/summary")
-        if r.status_code == 200:
+        if r_calendar.status_code == 200:
             log(f"✅ /api/calendar/summary: OK", "green")
         else:
             log(f"❌ /api/calendar/summary: Failed", "red")
 
         # Profile
-        r = await client.get("/api/profile")
-        if r.status_code == 200:
+        if r_profile.status_code == 200:
             log(f"✅ /api/profile: OK", "green")
         else:
             log(f"❌ /api/profile: Failed", "red")
             
         # APIs School
-        r = await client.get("/api/school")
-        if r.status_code == 200:
-            log(f"✅ /api/school: OK ({r.json().get('short')})", "green")
+        if r_school.status_code == 200:
+            log(f"✅ /api/school: OK ({orjson.loads(r_school.content).get('short')})", "green")
         else:
             log(f"❌ /api/school: Failed", "red")
 
@@ -94,14 +114,14 @@ async def check_api():
 async def check_ws():
     log("\n--- 3. WebSocket Chat Check ---", "cyan")
     try:
-        async with websockets.connect(WS_URL, open_timeout=5) as ws:
+        async with websockets.connect(WS_URL, open_timeout=5, compression="deflate") as ws:
             # Initial state
-            init_msg = json.loads(await ws.recv())
+            init_msg = orjson.loads(await ws.recv())
             log(f"✅ WS Connected (State: {init_msg.get('state')})", "green")
 
             # Send Chat
             log("Sending: 'Hello Vuddy'", "yellow")
-            await ws.send(json.dumps({"type": "chat", "text": "Hello Vuddy"}))
+            await ws.send(CHAT_FRAME)
 
             # Wait for response
             got_audio = False
@@ -109,7 +129,7 @@ async def check_ws():
             
             while not (got_audio and got_text):
                 try:
-                    msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=30))
+                    msg = orjson.loads(await asyncio.wait_for(ws.recv(), timeout=30))
                     mtype = msg.get("type")
                     
                     if mtype == "assistant_text":
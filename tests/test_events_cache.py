@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+
+from backend import events_service
+
+
+class _FakeDatetime(datetime):
+    current: datetime
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+def _event(event_id: str, start: str, end: str) -> dict:
+    return {"id": event_id, "title": event_id, "start": start, "end": end, "location": "", "tags": [], "description": ""}
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    events = [
+        _event("feb13", "2026-02-13T19:00:00", "2026-02-13T22:00:00"),
+        _event("feb14", "2026-02-14T19:00:00", "2026-02-14T22:00:00"),
+    ]
+    monkeypatch.setattr(_FakeDatetime, "current", datetime(2026, 2, 12, 20, 0), raising=False)
+    monkeypatch.setattr(events_service, "datetime", _FakeDatetime)
+    monkeypatch.setattr(events_service.time, "time", lambda: _FakeDatetime.current.timestamp())
+    monkeypatch.setattr(events_service, "_events_cache", events)
+    events_service._prepare_events(events)
+    events_service._named_range.cache_clear()
+    yield _FakeDatetime
+    events_service._named_range.cache_clear()
+    events_service._get_events_cache.clear()
+    # Next _load_events re-reads the real seed file
+    events_service._events_cache = None
+
+
+def _titles(events: list[dict]) -> list[str]:
+    return [e["title"] for e in events]
+
+
+def test_named_range_cache_hits_within_the_day(fake_clock):
+    first = events_service.get_events("tomorrow")
+    fake_clock.current = datetime(2026, 2, 12, 23, 0)
+    assert events_service.get_events("tomorrow") is first
+    assert _titles(first["events"]) == ["feb13"]
+
+
+def test_named_range_cache_does_not_outlive_midnight(fake_clock):
+    assert _titles(events_service.get_events("tomorrow")["events"]) == ["feb13"]
+    fake_clock.current = datetime(2026, 2, 13, 9, 0)
+    assert _titles(events_service.get_events("tomorrow")["events"]) == ["feb14"]
+
+
+def test_multi_range_cache_does_not_outlive_midnight(fake_clock):
+    ranges = ["tomorrow", "this weekend"]
+    assert _titles(events_service.get_events_multi(ranges)["tomorrow"]) == ["feb13"]
+    fake_clock.current = datetime(2026, 2, 13, 9, 0)
+    assert _titles(events_service.get_events_multi(ranges)["tomorrow"]) == ["feb14"]
+
+
+def test_multi_range_result_keeps_caller_spelling(fake_clock):
+    events_service.get_events_multi(["Today", "tomorrow"])
+    assert list(events_service.get_events_multi(["today", "tomorrow"])) == ["today", "tomorrow"]